@@ -39,7 +39,7 @@ def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
     graph.add_node("start_node", start)
 
     # Get analyst nodes from the configuration
-    analyst_nodes = {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+    analyst_nodes = {key: (f"{key}_agent", config.agent_func) for key, config in ANALYST_CONFIG.items()}
     
     # Extract agent IDs from graph structure
     agent_ids = [node.id for node in graph_nodes]
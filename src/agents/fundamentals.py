@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.api_key import get_api_key_from_state
 from src.utils.progress import progress
-import json
+from src.utils.serialization import to_json
+import numpy as np
 
-from src.tools.api import get_financial_metrics, get_prices, prices_to_df
+from src.tools.api import get_all_24h_stats, get_prices, prices_to_arrays
 
 
 ##### Crypto Fundamental Agent #####
@@ -23,46 +26,75 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
     start_date = data["start_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "BINANCE_API_KEY")
-    
+
+    # Share parsed price arrays across agents in the same run so each
+    # ticker's history is only fetched and converted once per workflow
+    price_arrays_cache = data.setdefault("_price_arrays_cache", {})
+
     # Initialize fundamental analysis for each ticker
     fundamental_analysis = {}
 
-    for ticker in tickers:
-        progress.update_status(agent_id, ticker, "Fetching crypto metrics")
+    # Get the crypto market metrics (24hr stats from Binance) for all tickers
+    # in one batched request instead of one round trip per ticker
+    progress.update_status(agent_id, None, "Fetching crypto metrics for all tickers")
+    stats_by_symbol = get_all_24h_stats(
+        symbols=tickers,
+        end_date=end_date,
+        period="24h",
+        limit=1,
+        api_key=api_key,
+    )
 
-        # Get the crypto market metrics (24hr stats from Binance)
-        financial_metrics = get_financial_metrics(
-            symbol=ticker,
-            end_date=end_date,
-            period="24h",
-            limit=1,
-            api_key=api_key,
-        )
+    def fetch_price_history(ticker: str):
+        """Fetch price history for one ticker (runs in a worker thread)."""
+        # Get price history for trend analysis (reuse if another agent already fetched it)
+        price_arrays = price_arrays_cache.get(ticker)
+        if price_arrays is None:
+            prices = get_prices(
+                symbol=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                interval="1d",
+                api_key=api_key,
+            )
+            if prices:
+                price_arrays = prices_to_arrays(prices)
+                price_arrays_cache[ticker] = price_arrays
+
+        return price_arrays
+
+    # The fetch phase is purely I/O-bound, so issue all requests concurrently
+    # and keep the analysis (and progress updates) on the main thread
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(tickers)))) as executor:
+        fetched = dict(zip(tickers, executor.map(fetch_price_history, tickers)))
+
+    for ticker in tickers:
+        financial_metrics = stats_by_symbol.get(ticker, [])
+        price_arrays = fetched[ticker]
 
         if not financial_metrics:
             progress.update_status(agent_id, ticker, "Failed: No crypto metrics found")
             continue
 
-        # Get price history for trend analysis
-        prices = get_prices(
-            symbol=ticker,
-            start_date=start_date,
-            end_date=end_date,
-            interval="1d",
-            api_key=api_key,
-        )
-        
-        if not prices:
+        if price_arrays is None:
             progress.update_status(agent_id, ticker, "Failed: No price data found")
             continue
-            
-        prices_df = prices_to_df(prices)
 
         # Pull the most recent metrics
         metrics = financial_metrics[0]
 
-        # Initialize signals list for different fundamental aspects
-        signals = []
+        # Extract the raw arrays once; all stats below are computed on NumPy
+        # views instead of repeated pandas tail()/iloc chains
+        close = price_arrays['close']
+        volume = price_arrays['volume']
+        daily_returns = np.diff(close) / close[:-1]
+        num_days = close.size
+
+        # Tally signals for the different fundamental aspects as they are
+        # produced instead of rescanning a list at the end
+        bullish_signals = 0
+        bearish_signals = 0
+        total_signals = 0
         reasoning = {}
 
         progress.update_status(agent_id, ticker, "Analyzing trading activity")
@@ -72,8 +104,8 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
         price_change_24h = metrics.return_on_equity if metrics.return_on_equity else 0.0
         
         # Calculate volume trend (recent vs average)
-        avg_volume = prices_df['volume'].tail(30).mean() if len(prices_df) >= 30 else prices_df['volume'].mean()
-        recent_volume = prices_df['volume'].tail(3).mean()
+        avg_volume = volume[-30:].mean() if num_days >= 30 else volume.mean()
+        recent_volume = volume[-3:].mean()
         volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1.0
         
         activity_score = 0
@@ -84,19 +116,22 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
         if market_cap and market_cap > 1_000_000_000:  # Market cap > $1B indicates mature crypto
             activity_score += 1
 
-        signals.append("bullish" if activity_score >= 2 else "bearish" if activity_score == 0 else "neutral")
+        activity_signal = "bullish" if activity_score >= 2 else "bearish" if activity_score == 0 else "neutral"
+        bullish_signals += activity_signal == "bullish"
+        bearish_signals += activity_signal == "bearish"
+        total_signals += 1
         reasoning["trading_activity_signal"] = {
-            "signal": signals[0],
+            "signal": activity_signal,
             "details": f"24h Change: {price_change_24h:.2%}, Volume Ratio: {volume_ratio:.2f}, Market Cap: ${market_cap/1e9:.2f}B" if market_cap else f"24h Change: {price_change_24h:.2%}, Volume Ratio: {volume_ratio:.2f}",
         }
 
         progress.update_status(agent_id, ticker, "Analyzing price momentum")
         # 2. Price Momentum & Trend Analysis (replaces growth for stocks)
         # Calculate moving averages
-        if len(prices_df) >= 50:
-            ma_20 = prices_df['close'].tail(20).mean()
-            ma_50 = prices_df['close'].tail(50).mean()
-            current_price = prices_df['close'].iloc[-1]
+        if num_days >= 50:
+            ma_20 = close[-20:].mean()
+            ma_50 = close[-50:].mean()
+            current_price = close[-1]
             
             momentum_score = 0
             if current_price > ma_20:  # Price above 20-day MA
@@ -106,23 +141,24 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
             if ma_20 > ma_50:  # 20-day MA above 50-day MA (golden cross direction)
                 momentum_score += 1
             
-            signals.append("bullish" if momentum_score >= 2 else "bearish" if momentum_score == 0 else "neutral")
+            momentum_signal = "bullish" if momentum_score >= 2 else "bearish" if momentum_score == 0 else "neutral"
+            bullish_signals += momentum_signal == "bullish"
+            bearish_signals += momentum_signal == "bearish"
             reasoning["momentum_signal"] = {
-                "signal": signals[1],
+                "signal": momentum_signal,
                 "details": f"Price: ${current_price:.2f}, MA20: ${ma_20:.2f}, MA50: ${ma_50:.2f}",
             }
         else:
-            signals.append("neutral")
             reasoning["momentum_signal"] = {
                 "signal": "neutral",
                 "details": "Insufficient data for momentum analysis",
             }
+        total_signals += 1
 
         progress.update_status(agent_id, ticker, "Analyzing volatility")
         # 3. Volatility Analysis (replaces financial health for stocks)
         # Lower volatility in crypto can indicate stability and maturity
-        daily_returns = prices_df['close'].pct_change().dropna()
-        volatility_30d = daily_returns.tail(30).std() if len(daily_returns) >= 30 else daily_returns.std()
+        volatility_30d = daily_returns[-30:].std(ddof=1) if daily_returns.size >= 30 else daily_returns.std(ddof=1)
         
         # For crypto, moderate volatility is acceptable; extreme is risky
         volatility_score = 0
@@ -133,16 +169,19 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
         else:  # High volatility (>8% daily)
             volatility_score = 0  # Risky
         
-        signals.append("bullish" if volatility_score >= 1 else "bearish")
+        volatility_signal = "bullish" if volatility_score >= 1 else "bearish"
+        bullish_signals += volatility_signal == "bullish"
+        bearish_signals += volatility_signal == "bearish"
+        total_signals += 1
         reasoning["volatility_signal"] = {
-            "signal": signals[2],
+            "signal": volatility_signal,
             "details": f"30-day Volatility: {volatility_30d:.2%}",
         }
 
         progress.update_status(agent_id, ticker, "Analyzing price trends")
         # 4. Short-term vs Long-term Performance
-        price_change_7d = (prices_df['close'].iloc[-1] / prices_df['close'].iloc[-7] - 1) if len(prices_df) >= 7 else 0
-        price_change_30d = (prices_df['close'].iloc[-1] / prices_df['close'].iloc[-30] - 1) if len(prices_df) >= 30 else 0
+        price_change_7d = (close[-1] / close[-7] - 1) if num_days >= 7 else 0
+        price_change_30d = (close[-1] / close[-30] - 1) if num_days >= 30 else 0
         
         performance_score = 0
         if price_change_7d > 0:  # Positive 7-day performance
@@ -152,17 +191,17 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
         if price_change_7d > price_change_30d:  # Accelerating uptrend
             performance_score += 1
 
-        signals.append("bullish" if performance_score >= 2 else "bearish" if performance_score == 0 else "neutral")
+        performance_signal = "bullish" if performance_score >= 2 else "bearish" if performance_score == 0 else "neutral"
+        bullish_signals += performance_signal == "bullish"
+        bearish_signals += performance_signal == "bearish"
+        total_signals += 1
         reasoning["performance_signal"] = {
-            "signal": signals[3],
+            "signal": performance_signal,
             "details": f"7-day: {price_change_7d:.2%}, 30-day: {price_change_30d:.2%}",
         }
 
         progress.update_status(agent_id, ticker, "Calculating final signal")
         # Determine overall signal
-        bullish_signals = signals.count("bullish")
-        bearish_signals = signals.count("bearish")
-
         if bullish_signals > bearish_signals:
             overall_signal = "bullish"
         elif bearish_signals > bullish_signals:
@@ -171,7 +210,6 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
             overall_signal = "neutral"
 
         # Calculate confidence level
-        total_signals = len(signals)
         confidence = round(max(bullish_signals, bearish_signals) / total_signals, 2) * 100
 
         fundamental_analysis[ticker] = {
@@ -180,17 +218,20 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
             "reasoning": reasoning,
         }
 
-        # Format reasoning as plain text for display
-        reasoning_text = f"Signal: {overall_signal.upper()} (Confidence: {confidence}%)\n\n"
-        for key, value in reasoning.items():
-            signal_name = key.replace("_", " ").title()
-            reasoning_text += f"{signal_name}: {value['signal'].upper()}\n{value['details']}\n\n"
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=reasoning_text.strip())
+        # Format reasoning as plain text for display, but only when something
+        # is actually watching — the text is several KB per ticker otherwise
+        if state["metadata"]["show_reasoning"] or progress.is_attached():
+            reasoning_parts = [f"Signal: {overall_signal.upper()} (Confidence: {confidence}%)\n\n"]
+            for key, value in reasoning.items():
+                signal_name = key.replace("_", " ").title()
+                reasoning_parts.append(f"{signal_name}: {value['signal'].upper()}\n{value['details']}\n\n")
+            progress.update_status(agent_id, ticker, "Done", analysis="".join(reasoning_parts).strip())
+        else:
+            progress.update_status(agent_id, ticker, "Done")
 
     # Create the fundamental analysis message
     message = HumanMessage(
-        content=json.dumps(fundamental_analysis),
+        content=to_json(fundamental_analysis),
         name=agent_id,
     )
 
@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
-import json
+from src.tools.api import get_prices, prices_to_arrays
+from src.utils.serialization import to_json
 import numpy as np
 import pandas as pd
 from src.utils.api_key import get_api_key_from_state
@@ -34,27 +36,48 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "BINANCE_API_KEY")
     
+    # Share parsed price arrays across agents in the same run so each
+    # ticker's history is only fetched and converted once per workflow
+    price_arrays_cache = data.setdefault("_price_arrays_cache", {})
+
     # Initialize risk analysis for each ticker
     risk_analysis = {}
     current_prices = {}  # Store prices here to avoid redundant API calls
     volatility_data = {}  # Store volatility metrics
-    returns_by_ticker: dict[str, pd.Series] = {}  # For correlation analysis
+    returns_by_ticker: dict[str, np.ndarray] = {}  # For correlation analysis
 
     # First, fetch prices and calculate volatility for all relevant tickers
     all_tickers = set(tickers) | set(portfolio.get("positions", {}).keys())
-    
-    for ticker in all_tickers:
-        progress.update_status(agent_id, ticker, "Fetching price data and calculating volatility")
-        
-        prices = get_prices(
-            symbol=ticker,
-            start_date=data["start_date"],
-            end_date=data["end_date"],
-            api_key=api_key,
-        )
 
-        if not prices:
-            progress.update_status(agent_id, ticker, "Warning: No price data found")
+    def fetch_price_arrays(ticker: str) -> dict[str, np.ndarray] | None:
+        """Fetch and parse price history for one ticker (runs in a worker thread)."""
+        price_arrays = price_arrays_cache.get(ticker)
+        if price_arrays is None:
+            prices = get_prices(
+                symbol=ticker,
+                start_date=data["start_date"],
+                end_date=data["end_date"],
+                api_key=api_key,
+            )
+            if not prices:
+                return None
+            price_arrays = prices_to_arrays(prices)
+            price_arrays_cache[ticker] = price_arrays
+        return price_arrays
+
+    # The fetch phase is purely I/O-bound, so issue all requests concurrently
+    # and keep the analysis (and progress updates) on the main thread
+    progress.update_status(agent_id, None, "Fetching price data for all tickers")
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(all_tickers)))) as executor:
+        fetched_arrays = dict(zip(all_tickers, executor.map(fetch_price_arrays, all_tickers)))
+
+    # Coalesce the per-ticker status messages into one batched progress update
+    # so the loop doesn't pay a display refresh (and handler fan-out) per call
+    volatility_statuses = []
+    for ticker in all_tickers:
+        price_arrays = fetched_arrays.get(ticker)
+        if price_arrays is None:
+            volatility_statuses.append((ticker, "Warning: No price data found"))
             volatility_data[ticker] = {
                 "daily_volatility": 0.05,  # Default fallback volatility (5% daily)
                 "annualized_volatility": 0.05 * np.sqrt(252),
@@ -63,45 +86,37 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
             }
             continue
 
-        prices_df = prices_to_df(prices)
-        
-        if not prices_df.empty and len(prices_df) > 1:
-            current_price = prices_df["close"].iloc[-1]
+        close = price_arrays["close"]
+        if close.size > 1:
+            current_price = close[-1]
             current_prices[ticker] = current_price
-            
+
+            # Compute close-to-close returns once; both the volatility metrics
+            # and the correlation analysis consume them
+            daily_returns = np.diff(close) / close[:-1]
+
             # Calculate volatility metrics
-            volatility_metrics = calculate_volatility_metrics(prices_df)
+            volatility_metrics = calculate_volatility_metrics(daily_returns)
             volatility_data[ticker] = volatility_metrics
 
-            # Store returns for correlation analysis (use close-to-close returns)
-            daily_returns = prices_df["close"].pct_change().dropna()
-            if len(daily_returns) > 0:
+            # Store returns for correlation analysis
+            if daily_returns.size > 0:
                 returns_by_ticker[ticker] = daily_returns
             
-            progress.update_status(
-                agent_id, 
-                ticker, 
-                f"Price: {current_price:.2f}, Ann. Vol: {volatility_metrics['annualized_volatility']:.1%}"
+            volatility_statuses.append(
+                (ticker, f"Price: {current_price:.2f}, Ann. Vol: {volatility_metrics['annualized_volatility']:.1%}")
             )
         else:
-            progress.update_status(agent_id, ticker, "Warning: Insufficient price data")
+            volatility_statuses.append((ticker, "Warning: Insufficient price data"))
             current_prices[ticker] = 0
             volatility_data[ticker] = {
                 "daily_volatility": 0.05,
                 "annualized_volatility": 0.05 * np.sqrt(252),
                 "volatility_percentile": 100,
-                "data_points": len(prices_df) if not prices_df.empty else 0
+                "data_points": int(close.size)
             }
 
-    # Build returns DataFrame aligned across tickers for correlation analysis
-    correlation_matrix = None
-    if len(returns_by_ticker) >= 2:
-        try:
-            returns_df = pd.DataFrame(returns_by_ticker).dropna(how="any")
-            if returns_df.shape[1] >= 2 and returns_df.shape[0] >= 5:
-                correlation_matrix = returns_df.corr()
-        except Exception:
-            correlation_matrix = None
+    progress.update_statuses(agent_id, volatility_statuses)
 
     # Determine which tickers currently have exposure (non-zero absolute position)
     active_positions = {
@@ -109,18 +124,65 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
         if abs(pos.get("long", 0) - pos.get("short", 0)) > 0
     }
 
-    # Calculate total portfolio value based on current market prices (Net Liquidation Value)
-    total_portfolio_value = portfolio.get("cash", 0.0)
-    
-    for ticker, position in portfolio.get("positions", {}).items():
-        if ticker in current_prices:
-            # Add market value of long positions
-            total_portfolio_value += position.get("long", 0) * current_prices[ticker]
-            # Subtract market value of short positions
-            total_portfolio_value -= position.get("short", 0) * current_prices[ticker]
-    
+    # Correlation adjustments only matter relative to existing exposure, so
+    # skip the whole matrix on the common "empty portfolio" run
+    compute_correlations = bool(active_positions) and len(returns_by_ticker) >= 2
+
+    # Build an aligned returns matrix across tickers for correlation analysis.
+    # Stacking into a single (K, T) ndarray and calling np.corrcoef replaces
+    # the pairwise pandas DataFrame.corr() pass with one vectorized call.
+    corr_matrix = None
+    corr_tickers: list[str] = []
+    corr_index: dict[str, int] = {}
+    if compute_correlations:
+        try:
+            corr_tickers = list(returns_by_ticker)
+            # Every series comes from the same start/end window at a daily
+            # interval, so aligning on the trailing overlap is equivalent to
+            # (and much cheaper than) a pandas index join
+            common_len = min(r.size for r in returns_by_ticker.values())
+            if common_len >= 5:
+                returns_matrix = np.vstack(
+                    [returns_by_ticker[t][-common_len:] for t in corr_tickers]
+                )
+                corr_matrix = np.corrcoef(returns_matrix)
+                corr_index = {t: i for i, t in enumerate(corr_tickers)}
+        except Exception:
+            corr_matrix = None
+
+    # Calculate total portfolio value based on current market prices (Net Liquidation Value):
+    # cash + prices . (longs - shorts) as a single NumPy reduction
+    pos_items = list(portfolio.get("positions", {}).items())
+    longs = np.fromiter((pos.get("long", 0) for _, pos in pos_items), dtype=np.float64, count=len(pos_items))
+    shorts = np.fromiter((pos.get("short", 0) for _, pos in pos_items), dtype=np.float64, count=len(pos_items))
+    pos_prices = np.fromiter((current_prices.get(t, 0.0) for t, _ in pos_items), dtype=np.float64, count=len(pos_items))
+    total_portfolio_value = portfolio.get("cash", 0.0) + float(pos_prices @ (longs - shorts))
+
+    # Cache the per-position long/short market values computed during the NLV
+    # pass so the per-ticker limit loop below doesn't redo the multiplication
+    position_values = {
+        t: (float(lv), float(sv))
+        for (t, _), lv, sv in zip(pos_items, longs * pos_prices, shorts * pos_prices)
+    }
+
     progress.update_status(agent_id, None, f"Total portfolio value: {total_portfolio_value:.2f}")
 
+    # Precompute the integer positions of active tickers in the correlation
+    # matrix once, so the per-ticker loop below only does ndarray row slicing
+    if corr_matrix is not None:
+        active_idx = np.fromiter(
+            (corr_index[t] for t in active_positions if t in corr_index), dtype=np.intp
+        )
+        all_idx = np.arange(len(corr_tickers), dtype=np.intp)
+    else:
+        active_idx = all_idx = np.empty(0, dtype=np.intp)
+
+    # Volatility-adjusted limit pct for all tickers in one vectorized batch
+    vol_limits = calculate_volatility_adjusted_limits(
+        np.array([volatility_data.get(t, {}).get("annualized_volatility", 0.25) for t in tickers])
+    )
+    vol_limit_by_ticker = dict(zip(tickers, vol_limits))
+
     # Calculate volatility- and correlation-adjusted risk limits for each ticker
     for ticker in tickers:
         progress.update_status(agent_id, ticker, "Calculating volatility- and correlation-adjusted limits")
@@ -139,16 +201,12 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
         current_price = current_prices[ticker]
         vol_data = volatility_data.get(ticker, {})
         
-        # Calculate current market value of this position
-        position = portfolio.get("positions", {}).get(ticker, {})
-        long_value = position.get("long", 0) * current_price
-        short_value = position.get("short", 0) * current_price
+        # Current market value of this position (precomputed during the NLV pass)
+        long_value, short_value = position_values.get(ticker, (0.0, 0.0))
         current_position_value = abs(long_value - short_value)  # Use absolute exposure
         
-        # Volatility-adjusted limit pct
-        vol_adjusted_limit_pct = calculate_volatility_adjusted_limit(
-            vol_data.get("annualized_volatility", 0.25)
-        )
+        # Volatility-adjusted limit pct (precomputed for the whole batch above)
+        vol_adjusted_limit_pct = float(vol_limit_by_ticker[ticker])
 
         # Correlation adjustment
         corr_metrics = {
@@ -157,25 +215,31 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
             "top_correlated_tickers": [],
         }
         corr_multiplier = 1.0
-        if correlation_matrix is not None and ticker in correlation_matrix.columns:
-            # Compute correlations with active positions (exclude self)
-            comparable = [t for t in active_positions if t in correlation_matrix.columns and t != ticker]
-            if not comparable:
-                # If no active positions, compare with all other available tickers
-                comparable = [t for t in correlation_matrix.columns if t != ticker]
-            if comparable:
-                series = correlation_matrix.loc[ticker, comparable]
+        if corr_matrix is not None and ticker in corr_index:
+            # Compare against active positions (exclude self); if no active
+            # positions, fall back to all other available tickers
+            i = corr_index[ticker]
+            neighbor_idx = active_idx[active_idx != i]
+            if neighbor_idx.size == 0:
+                neighbor_idx = all_idx[all_idx != i]
+            if neighbor_idx.size > 0:
+                row = corr_matrix[i, neighbor_idx]
                 # Drop NaNs just in case
-                series = series.dropna()
-                if len(series) > 0:
-                    avg_corr = float(series.mean())
-                    max_corr = float(series.max())
+                valid = ~np.isnan(row)
+                row = row[valid]
+                neighbor_idx = neighbor_idx[valid]
+                if row.size > 0:
+                    avg_corr = float(row.mean())
+                    max_corr = float(row.max())
                     corr_metrics["avg_correlation_with_active"] = avg_corr
                     corr_metrics["max_correlation_with_active"] = max_corr
-                    # Top 3 most correlated tickers
-                    top_corr = series.sort_values(ascending=False).head(3)
+                    # Top 3 most correlated tickers: argpartition selects the
+                    # candidates in O(K), then only those few are sorted
+                    k = min(3, row.size)
+                    top_order = np.argpartition(-row, k - 1)[:k]
+                    top_order = top_order[np.argsort(-row[top_order])]
                     corr_metrics["top_correlated_tickers"] = [
-                        {"ticker": idx, "correlation": float(val)} for idx, val in top_corr.items()
+                        {"ticker": corr_tickers[neighbor_idx[j]], "correlation": float(row[j])} for j in top_order
                     ]
                     corr_multiplier = calculate_correlation_multiplier(avg_corr)
         
@@ -222,7 +286,7 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     progress.update_status(agent_id, None, "Done")
 
     message = HumanMessage(
-        content=json.dumps(risk_analysis),
+        content=to_json(risk_analysis),
         name=agent_id,
     )
 
@@ -238,92 +302,97 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     }
 
 
-def calculate_volatility_metrics(prices_df: pd.DataFrame, lookback_days: int = 60) -> dict:
+def _volatility_kernel(daily_returns: np.ndarray, lookback_days: int, window: int = 30) -> tuple[float, float, float]:
     """
-    Calculate comprehensive volatility metrics from price data.
-    
+    Numeric kernel for volatility metrics, operating on a raw returns array.
+
+    Returns (daily_vol, annualized_vol, volatility_percentile). Kept free of
+    pandas so the whole computation is a handful of vectorized NumPy calls.
+    """
+    recent_returns = daily_returns[-min(lookback_days, daily_returns.size):]
+    daily_vol = recent_returns.std(ddof=1)
+    # For crypto: Annualize using 365 days (24/7 trading)
+    annualized_vol = daily_vol * np.sqrt(365)
+
+    # Percentile rank of recent volatility vs historical rolling volatility
+    if daily_returns.size >= window:  # Need sufficient history for percentile calculation
+        # Running-moment rolling std: prefix sums of r and r^2 give every
+        # window's variance in O(n) instead of rescanning each window
+        cum_sum = np.cumsum(daily_returns)
+        cum_sq = np.cumsum(daily_returns * daily_returns)
+        win_sum = cum_sum[window - 1:].copy()
+        win_sum[1:] -= cum_sum[:-window]
+        win_sq = cum_sq[window - 1:].copy()
+        win_sq[1:] -= cum_sq[:-window]
+        rolling_var = (win_sq - win_sum * win_sum / window) / (window - 1)
+        rolling_vol = np.sqrt(np.maximum(rolling_var, 0.0))
+        # The latest window can equal daily_vol exactly (e.g. lookback ==
+        # window); compare with a relative tolerance so one-pass rounding
+        # noise cannot flip that window from percentile 100 to 0
+        current_vol_percentile = (rolling_vol <= daily_vol * (1 + 1e-9)).mean() * 100
+    else:
+        current_vol_percentile = 50.0  # Default to median if insufficient data
+
+    return daily_vol, annualized_vol, current_vol_percentile
+
+
+def calculate_volatility_metrics(daily_returns: np.ndarray, lookback_days: int = 60) -> dict:
+    """
+    Calculate comprehensive volatility metrics from a daily returns array.
+
+    The caller computes the returns once (pct_change on close) and shares the
+    same array with the correlation analysis, so the derivation is not repeated.
+
     For crypto: Uses 365 days for annualization since crypto trades 24/7.
     """
-    if len(prices_df) < 2:
-        return {
-            "daily_volatility": CRYPTO_RISK_FACTORS["safe_volatility_threshold"],
-            "annualized_volatility": CRYPTO_RISK_FACTORS["safe_volatility_threshold"] * np.sqrt(365),
-            "volatility_percentile": 100,
-            "data_points": len(prices_df)
-        }
-    
-    # Calculate daily returns
-    daily_returns = prices_df["close"].pct_change().dropna()
-    
-    if len(daily_returns) < 2:
+    if daily_returns.size < 2:
         return {
             "daily_volatility": CRYPTO_RISK_FACTORS["safe_volatility_threshold"],
             "annualized_volatility": CRYPTO_RISK_FACTORS["safe_volatility_threshold"] * np.sqrt(365),
             "volatility_percentile": 100,
-            "data_points": len(daily_returns)
+            "data_points": int(daily_returns.size)
         }
-    
-    # Use the most recent lookback_days for volatility calculation
-    recent_returns = daily_returns.tail(min(lookback_days, len(daily_returns)))
-    
-    # Calculate volatility metrics
-    daily_vol = recent_returns.std()
-    # For crypto: Annualize using 365 days (24/7 trading)
-    annualized_vol = daily_vol * np.sqrt(365)  # Crypto trades every day
-    
-    # Calculate percentile rank of recent volatility vs historical volatility
-    if len(daily_returns) >= 30:  # Need sufficient history for percentile calculation
-        # Calculate 30-day rolling volatility for the full history
-        rolling_vol = daily_returns.rolling(window=30).std().dropna()
-        if len(rolling_vol) > 0:
-            # Compare current volatility against historical rolling volatilities
-            current_vol_percentile = (rolling_vol <= daily_vol).mean() * 100
-        else:
-            current_vol_percentile = 50  # Default to median
-    else:
-        current_vol_percentile = 50  # Default to median if insufficient data
-    
+
+    daily_vol, annualized_vol, current_vol_percentile = _volatility_kernel(daily_returns, lookback_days)
+
     return {
         "daily_volatility": float(daily_vol) if not np.isnan(daily_vol) else CRYPTO_RISK_FACTORS["safe_volatility_threshold"],
         "annualized_volatility": float(annualized_vol) if not np.isnan(annualized_vol) else CRYPTO_RISK_FACTORS["safe_volatility_threshold"] * np.sqrt(365),
         "volatility_percentile": float(current_vol_percentile) if not np.isnan(current_vol_percentile) else 50.0,
-        "data_points": len(recent_returns)
+        "data_points": int(min(lookback_days, daily_returns.size))
     }
 
 
-def calculate_volatility_adjusted_limit(annualized_volatility: float) -> float:
+def calculate_volatility_adjusted_limits(annualized_volatilities: np.ndarray) -> np.ndarray:
     """
-    Calculate position limit as percentage of portfolio based on volatility.
-    
+    Calculate position limits as percentage of portfolio based on volatility,
+    vectorized over an array of annualized volatilities (one entry per ticker).
+
     Crypto-adjusted logic (more conservative due to higher volatility):
     - Low volatility (<25%): Up to 15% allocation (vs 25% for stocks)
-    - Medium volatility (25-50%): 10-15% allocation  
+    - Medium volatility (25-50%): 10-15% allocation
     - High volatility (50-75%): 5-10% allocation
     - Very high volatility (>75%): Max 5% allocation
     - Extreme volatility (>100%): Max 2% allocation
     """
-    base_limit = CRYPTO_RISK_FACTORS["max_position_size"]  # 15% baseline for crypto
-    
-    if annualized_volatility < 0.25:  # Low volatility for crypto
-        # Allow standard allocation for stable crypto
-        vol_multiplier = 1.0  # Up to 15%
-    elif annualized_volatility < 0.50:  # Medium volatility  
-        # Reduce allocation moderately
-        vol_multiplier = 0.85 - (annualized_volatility - 0.25) * 0.4  # 15% -> 10%
-    elif annualized_volatility < 0.75:  # High volatility
-        # Reduce allocation significantly
-        vol_multiplier = 0.65 - (annualized_volatility - 0.50) * 0.6  # 10% -> 5%
-    elif annualized_volatility < 1.00:  # Very high volatility
-        # Minimal allocation for very risky crypto
-        vol_multiplier = 0.30  # ~5%
-    else:  # Extreme volatility (>100%)
-        # Tiny allocation for extremely volatile crypto
-        vol_multiplier = 0.13  # ~2%
-    
-    # Apply bounds to ensure reasonable limits for crypto
-    vol_multiplier = max(0.13, min(1.0, vol_multiplier))  # 2% to 15% range
-    
-    return base_limit * vol_multiplier
+    vols = np.asarray(annualized_volatilities, dtype=np.float64)
+
+    # Branchless piecewise mapping of the if/elif ladder above
+    vol_multiplier = np.select(
+        [vols < 0.25, vols < 0.50, vols < 0.75, vols < 1.00],
+        [1.0, 0.85 - (vols - 0.25) * 0.4, 0.65 - (vols - 0.50) * 0.6, 0.30],
+        default=0.13,
+    )
+
+    # Apply bounds to ensure reasonable limits for crypto (2% to 15% range)
+    vol_multiplier = np.clip(vol_multiplier, 0.13, 1.0)
+
+    return CRYPTO_RISK_FACTORS["max_position_size"] * vol_multiplier
+
+
+def calculate_volatility_adjusted_limit(annualized_volatility: float) -> float:
+    """Scalar convenience wrapper around calculate_volatility_adjusted_limits."""
+    return float(calculate_volatility_adjusted_limits(np.array([annualized_volatility]))[0])
 
 
 def calculate_correlation_multiplier(avg_correlation: float) -> float:
@@ -1,11 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-import pandas as pd
 import numpy as np
 import json
+import re
 from src.utils.api_key import get_api_key_from_state
-from src.tools.api import get_company_news, get_prices, prices_to_df
+from src.tools.api import get_company_news, get_prices, prices_to_arrays
+
+
+# Weights for combining the three sentiment sources; constant across tickers
+TRADING_WEIGHT = 0.4
+NEWS_WEIGHT = 0.3
+VOLATILITY_WEIGHT = 0.3
+
+# The same weights as a vector, for the per-ticker weighted-sum dot products
+_WEIGHTS = np.array([TRADING_WEIGHT, NEWS_WEIGHT, VOLATILITY_WEIGHT])
+
+# Extracts the third space-separated word of each title line ("SELL" or "BUY"
+# in trade-activity titles); one pass over the joined titles replaces a
+# Python-level split per news item
+_TITLE_WORD2_RE = re.compile(r"^\S+[ \t]+\S+[ \t]+(\S+)", re.MULTILINE)
+
+
+def _sentiment_kernel(close: np.ndarray, volume: np.ndarray) -> tuple[float, float, float, int, int, int, int, int, int]:
+    """
+    Numeric kernel for the per-ticker sentiment stats and tallies.
+
+    Returns (volume_ratio, recent_returns, volatility_7d,
+    t_bull, t_bear, t_neu, v_bull, v_bear, v_neu). Kept free of strings and
+    pandas so the whole computation is a handful of vectorized NumPy calls;
+    the news analysis stays in the agent since it depends on titles.
+    """
+    returns = np.diff(close) / close[:-1]
+
+    # Trading activity: volume patterns plus price momentum
+    recent_volume = volume[-7:].mean()
+    historical_volume = volume[:-7].mean() if volume.size > 14 else volume.mean()
+    volume_ratio = recent_volume / historical_volume if historical_volume > 0 else 1.0
+    recent_returns = returns[-7:].mean()
+
+    t_bull = t_bear = t_neu = 0
+    if volume_ratio > 1.2:  # High volume
+        if recent_returns > 0:
+            t_bull += 3  # Strong bullish signal
+        else:
+            t_bear += 3  # Strong bearish signal (selling pressure)
+    elif volume_ratio > 1.0:  # Moderate volume increase
+        if recent_returns > 0:
+            t_bull += 1
+        else:
+            t_bear += 1
+    else:  # Low volume
+        t_neu += 1  # Indecisive market
+
+    # Volatility: high can be bullish (interest) or bearish (panic);
+    # price direction determines the interpretation
+    volatility_7d = returns[-7:].std(ddof=1)
+
+    v_bull = v_bear = v_neu = 0
+    if volatility_7d > 0.05:  # High volatility (>5% daily)
+        if recent_returns > 0:
+            v_bull += 1  # Volatile rally
+        else:
+            v_bear += 2  # Volatile selloff (more bearish)
+    elif volatility_7d < 0.02:  # Low volatility (<2% daily)
+        v_neu += 1  # Calm, consolidating
+    else:  # Moderate volatility
+        if recent_returns > 0:
+            v_bull += 1
+        else:
+            v_neu += 1
+
+    return volume_ratio, recent_returns, volatility_7d, t_bull, t_bear, t_neu, v_bull, v_bear, v_neu
+
+
+def _pick_signal(bullish: float, bearish: float) -> str:
+    """Resolve a bull/bear tally to a signal label; ties are neutral."""
+    if bullish > bearish:
+        return "bullish"
+    if bearish > bullish:
+        return "bearish"
+    return "neutral"
 
 
 ##### Crypto Sentiment Agent #####
@@ -26,134 +103,101 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
     tickers = data.get("tickers")
     api_key = get_api_key_from_state(state, "BINANCE_API_KEY")
     
+    # Share parsed price arrays across agents in the same run so each
+    # ticker's history is only fetched and converted once per workflow
+    price_arrays_cache = data.setdefault("_price_arrays_cache", {})
+
     # Initialize sentiment analysis for each ticker
     sentiment_analysis = {}
 
+    def fetch_price_arrays(ticker: str):
+        """Fetch and parse price history for one ticker (runs in a worker thread)."""
+        # Reuse if another agent already fetched it
+        price_arrays = price_arrays_cache.get(ticker)
+        if price_arrays is None:
+            prices = get_prices(
+                symbol=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                interval="1d",
+                api_key=api_key,
+            )
+            if prices:
+                price_arrays = prices_to_arrays(prices)
+                price_arrays_cache[ticker] = price_arrays
+        return price_arrays
+
+    def fetch_news(ticker: str):
+        """Fetch crypto news/trade data for one ticker (runs in a worker thread)."""
+        return get_company_news(symbol=ticker, end_date=end_date, limit=100, api_key=api_key)
+
+    # The fetch phase is purely I/O-bound, so issue all requests concurrently
+    # and keep the analysis (and progress updates) on the main thread. Prices
+    # and news are independent, so they get separate futures rather than being
+    # serialized pairwise inside one worker.
+    progress.update_status(agent_id, None, "Fetching price and news data for all tickers")
+    with ThreadPoolExecutor(max_workers=min(10, max(1, 2 * len(tickers)))) as executor:
+        price_futures = {ticker: executor.submit(fetch_price_arrays, ticker) for ticker in tickers}
+        news_futures = {ticker: executor.submit(fetch_news, ticker) for ticker in tickers}
+        fetched = {
+            ticker: (price_futures[ticker].result(), news_futures[ticker].result())
+            for ticker in tickers
+        }
+
     for ticker in tickers:
-        progress.update_status(agent_id, ticker, "Fetching price data for sentiment analysis")
-
-        # Get price data for volume and volatility analysis
-        prices = get_prices(
-            symbol=ticker,
-            start_date=start_date,
-            end_date=end_date,
-            interval="1d",
-            api_key=api_key,
-        )
-        
-        if not prices:
+        price_arrays, company_news = fetched[ticker]
+
+        if price_arrays is None:
             progress.update_status(agent_id, ticker, "Failed: No price data found")
             continue
-            
-        prices_df = prices_to_df(prices)
 
         progress.update_status(agent_id, ticker, "Analyzing trading activity sentiment")
 
-        # 1. Trading Activity Sentiment (replaces insider trading)
-        # Analyze volume patterns - increasing volume suggests growing interest
-        recent_volume = prices_df['volume'].tail(7).mean()
-        historical_volume = prices_df['volume'].head(-7).mean() if len(prices_df) > 14 else prices_df['volume'].mean()
-        volume_ratio = recent_volume / historical_volume if historical_volume > 0 else 1.0
-        
-        # Analyze price momentum
-        recent_returns = prices_df['close'].pct_change().tail(7).mean()
-        
-        # Volume + positive returns = bullish, volume + negative returns = bearish
-        trading_signals = []
-        if volume_ratio > 1.2:  # High volume
-            if recent_returns > 0:
-                trading_signals.extend(["bullish"] * 3)  # Strong bullish signal
-            else:
-                trading_signals.extend(["bearish"] * 3)  # Strong bearish signal (selling pressure)
-        elif volume_ratio > 1.0:  # Moderate volume increase
-            if recent_returns > 0:
-                trading_signals.append("bullish")
-            else:
-                trading_signals.append("bearish")
-        else:  # Low volume
-            trading_signals.append("neutral")  # Indecisive market
-
-        progress.update_status(agent_id, ticker, "Fetching crypto news")
+        # 1. Trading Activity Sentiment + 3. Volatility Sentiment
+        # The numeric stats and their bull/bear/neutral tallies come from one
+        # kernel call on the raw arrays; only the news analysis stays inline.
+        (
+            volume_ratio, recent_returns, volatility_7d,
+            t_bull, t_bear, t_neu,
+            v_bull, v_bear, v_neu,
+        ) = _sentiment_kernel(price_arrays['close'], price_arrays['volume'])
 
-        # 2. Get crypto news/trade data (adapted from get_company_news)
-        company_news = get_company_news(symbol=ticker, end_date=end_date, limit=100, api_key=api_key)
+        progress.update_status(agent_id, ticker, "Analyzing crypto news")
 
+        # 2. Crypto news/trade data (fetched above)
         # Note: get_company_news for crypto returns recent trades as news items
         # We can use this as a proxy for market activity
-        news_signals = []
+        n_bull = n_bear = n_neu = 0
         if company_news:
-            # Analyze the "news" (which is really trade data for crypto)
-            for news_item in company_news:
-                sentiment_word = news_item.title.split()[2]  # "SELL" or "BUY" from title
-                if "BUY" in sentiment_word:
-                    news_signals.append("bullish")
-                elif "SELL" in sentiment_word:
-                    news_signals.append("bearish")
-                else:
-                    news_signals.append("neutral")
+            # Analyze the "news" (which is really trade data for crypto):
+            # join the titles and scan once in the regex engine for word 2
+            words = _TITLE_WORD2_RE.findall("\n".join(news_item.title for news_item in company_news))
+            n_bull = sum("BUY" in word for word in words)
+            n_bear = sum("BUY" not in word and "SELL" in word for word in words)
+            n_neu = len(company_news) - n_bull - n_bear
         else:
             # If no news data, use price momentum as proxy
             if recent_returns > 0.02:  # >2% positive return
-                news_signals.extend(["bullish"] * 2)
+                n_bull += 2
             elif recent_returns < -0.02:  # >2% negative return
-                news_signals.extend(["bearish"] * 2)
+                n_bear += 2
             else:
-                news_signals.append("neutral")
-        
-        progress.update_status(agent_id, ticker, "Analyzing volatility sentiment")
-        
-        # 3. Volatility Sentiment
-        # High volatility can be bullish (high interest) or bearish (panic)
-        # Context from price direction determines interpretation
-        daily_returns = prices_df['close'].pct_change().dropna()
-        volatility_7d = daily_returns.tail(7).std()
-        
-        volatility_signals = []
-        if volatility_7d > 0.05:  # High volatility (>5% daily)
-            if recent_returns > 0:
-                volatility_signals.append("bullish")  # Volatile rally
-            else:
-                volatility_signals.extend(["bearish"] * 2)  # Volatile selloff (more bearish)
-        elif volatility_7d < 0.02:  # Low volatility (<2% daily)
-            volatility_signals.append("neutral")  # Calm, consolidating
-        else:  # Moderate volatility
-            if recent_returns > 0:
-                volatility_signals.append("bullish")
-            else:
-                volatility_signals.append("neutral")
+                n_neu += 1
         
         progress.update_status(agent_id, ticker, "Combining sentiment signals")
         
-        # Combine signals from all sources with weights
-        trading_weight = 0.4
-        news_weight = 0.3
-        volatility_weight = 0.3
-        
-        # Calculate weighted signal counts
-        bullish_signals = (
-            trading_signals.count("bullish") * trading_weight +
-            news_signals.count("bullish") * news_weight +
-            volatility_signals.count("bullish") * volatility_weight
-        )
-        bearish_signals = (
-            trading_signals.count("bearish") * trading_weight +
-            news_signals.count("bearish") * news_weight +
-            volatility_signals.count("bearish") * volatility_weight
-        )
-
-        if bullish_signals > bearish_signals:
-            overall_signal = "bullish"
-        elif bearish_signals > bullish_signals:
-            overall_signal = "bearish"
-        else:
-            overall_signal = "neutral"
-
-        # Calculate confidence level based on the weighted proportion
-        total_weighted_signals = (
-            len(trading_signals) * trading_weight + 
-            len(news_signals) * news_weight +
-            len(volatility_signals) * volatility_weight
-        )
+        # Combine signals from all sources with the module-level weights.
+        # One (3, 3) x (3,) product covers the bullish, bearish and total rows
+        trading_total = t_bull + t_bear + t_neu
+        news_total = n_bull + n_bear + n_neu
+        volatility_total = v_bull + v_bear + v_neu
+        bullish_signals, bearish_signals, total_weighted_signals = np.array([
+            [t_bull, n_bull, v_bull],
+            [t_bear, n_bear, v_bear],
+            [trading_total, news_total, volatility_total],
+        ], dtype=np.float64) @ _WEIGHTS
+
+        overall_signal = _pick_signal(bullish_signals, bearish_signals)
         confidence = 0  # Default confidence when there are no signals
         if total_weighted_signals > 0:
             confidence = round((max(bullish_signals, bearish_signals) / total_weighted_signals) * 100, 2)
@@ -161,50 +205,47 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
         # Create structured reasoning
         reasoning = {
             "trading_activity": {
-                "signal": "bullish" if trading_signals.count("bullish") > trading_signals.count("bearish") else 
-                         "bearish" if trading_signals.count("bearish") > trading_signals.count("bullish") else "neutral",
-                "confidence": round((max(trading_signals.count("bullish"), trading_signals.count("bearish")) / max(len(trading_signals), 1)) * 100),
+                "signal": _pick_signal(t_bull, t_bear),
+                "confidence": round((max(t_bull, t_bear) / max(trading_total, 1)) * 100),
                 "metrics": {
                     "volume_ratio": round(volume_ratio, 2),
                     "recent_return": f"{recent_returns:.2%}",
-                    "bullish_signals": trading_signals.count("bullish"),
-                    "bearish_signals": trading_signals.count("bearish"),
-                    "weight": trading_weight,
-                    "weighted_bullish": round(trading_signals.count("bullish") * trading_weight, 1),
-                    "weighted_bearish": round(trading_signals.count("bearish") * trading_weight, 1),
+                    "bullish_signals": t_bull,
+                    "bearish_signals": t_bear,
+                    "weight": TRADING_WEIGHT,
+                    "weighted_bullish": round(t_bull * TRADING_WEIGHT, 1),
+                    "weighted_bearish": round(t_bear * TRADING_WEIGHT, 1),
                 }
             },
             "market_activity": {
-                "signal": "bullish" if news_signals.count("bullish") > news_signals.count("bearish") else 
-                         "bearish" if news_signals.count("bearish") > news_signals.count("bullish") else "neutral",
-                "confidence": round((max(news_signals.count("bullish"), news_signals.count("bearish")) / max(len(news_signals), 1)) * 100),
+                "signal": _pick_signal(n_bull, n_bear),
+                "confidence": round((max(n_bull, n_bear) / max(news_total, 1)) * 100),
                 "metrics": {
-                    "total_events": len(news_signals),
-                    "bullish_events": news_signals.count("bullish"),
-                    "bearish_events": news_signals.count("bearish"),
-                    "neutral_events": news_signals.count("neutral"),
-                    "weight": news_weight,
-                    "weighted_bullish": round(news_signals.count("bullish") * news_weight, 1),
-                    "weighted_bearish": round(news_signals.count("bearish") * news_weight, 1),
+                    "total_events": news_total,
+                    "bullish_events": n_bull,
+                    "bearish_events": n_bear,
+                    "neutral_events": n_neu,
+                    "weight": NEWS_WEIGHT,
+                    "weighted_bullish": round(n_bull * NEWS_WEIGHT, 1),
+                    "weighted_bearish": round(n_bear * NEWS_WEIGHT, 1),
                 }
             },
             "volatility_sentiment": {
-                "signal": "bullish" if volatility_signals.count("bullish") > volatility_signals.count("bearish") else 
-                         "bearish" if volatility_signals.count("bearish") > volatility_signals.count("bullish") else "neutral",
-                "confidence": round((max(volatility_signals.count("bullish"), volatility_signals.count("bearish")) / max(len(volatility_signals), 1)) * 100),
+                "signal": _pick_signal(v_bull, v_bear),
+                "confidence": round((max(v_bull, v_bear) / max(volatility_total, 1)) * 100),
                 "metrics": {
                     "volatility_7d": f"{volatility_7d:.2%}",
-                    "bullish_signals": volatility_signals.count("bullish"),
-                    "bearish_signals": volatility_signals.count("bearish"),
-                    "weight": volatility_weight,
-                    "weighted_bullish": round(volatility_signals.count("bullish") * volatility_weight, 1),
-                    "weighted_bearish": round(volatility_signals.count("bearish") * volatility_weight, 1),
+                    "bullish_signals": v_bull,
+                    "bearish_signals": v_bear,
+                    "weight": VOLATILITY_WEIGHT,
+                    "weighted_bullish": round(v_bull * VOLATILITY_WEIGHT, 1),
+                    "weighted_bearish": round(v_bear * VOLATILITY_WEIGHT, 1),
                 }
             },
             "combined_analysis": {
                 "total_weighted_bullish": round(bullish_signals, 1),
                 "total_weighted_bearish": round(bearish_signals, 1),
-                "signal_determination": f"{'Bullish' if bullish_signals > bearish_signals else 'Bearish' if bearish_signals > bullish_signals else 'Neutral'} based on weighted signal comparison"
+                "signal_determination": f"{overall_signal.capitalize()} based on weighted signal comparison"
             }
         }
 
@@ -214,34 +255,35 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
             "reasoning": reasoning,
         }
 
-        # Format reasoning as plain text for display
-        reasoning_text = f"Signal: {overall_signal.upper()} (Confidence: {confidence}%)\n\n"
-        
-        # Trading Activity
-        ta = reasoning["trading_activity"]
-        reasoning_text += f"Trading Activity: {ta['signal'].upper()} ({ta['confidence']}%)\n"
-        reasoning_text += f"Volume Ratio: {ta['metrics']['volume_ratio']}, Recent Return: {ta['metrics']['recent_return']}\n"
-        reasoning_text += f"Bullish: {ta['metrics']['bullish_signals']}, Bearish: {ta['metrics']['bearish_signals']} (Weight: {ta['metrics']['weight']})\n\n"
-        
-        # Market Activity
-        ma = reasoning["market_activity"]
-        reasoning_text += f"Market Activity: {ma['signal'].upper()} ({ma['confidence']}%)\n"
-        reasoning_text += f"Total Events: {ma['metrics']['total_events']} (Bullish: {ma['metrics']['bullish_events']}, Bearish: {ma['metrics']['bearish_events']}, Neutral: {ma['metrics']['neutral_events']})\n"
-        reasoning_text += f"Weight: {ma['metrics']['weight']}\n\n"
-        
-        # Volatility Sentiment
-        vs = reasoning["volatility_sentiment"]
-        reasoning_text += f"Volatility Sentiment: {vs['signal'].upper()} ({vs['confidence']}%)\n"
-        reasoning_text += f"7-day Volatility: {vs['metrics']['volatility_7d']}\n"
-        reasoning_text += f"Bullish: {vs['metrics']['bullish_signals']}, Bearish: {vs['metrics']['bearish_signals']} (Weight: {vs['metrics']['weight']})\n\n"
-        
-        # Combined Analysis
-        ca = reasoning["combined_analysis"]
-        reasoning_text += f"Combined Analysis:\n"
-        reasoning_text += f"Total Weighted Bullish: {ca['total_weighted_bullish']}, Total Weighted Bearish: {ca['total_weighted_bearish']}\n"
-        reasoning_text += f"{ca['signal_determination']}"
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=reasoning_text)
+        # Format reasoning as plain text for display, but only when something
+        # is actually watching; the structured dict above is always published
+        if state["metadata"]["show_reasoning"] or progress.is_attached():
+            ta = reasoning["trading_activity"]
+            ma = reasoning["market_activity"]
+            vs = reasoning["volatility_sentiment"]
+            ca = reasoning["combined_analysis"]
+            reasoning_text = (
+                f"Signal: {overall_signal.upper()} (Confidence: {confidence}%)\n\n"
+                # Trading Activity
+                f"Trading Activity: {ta['signal'].upper()} ({ta['confidence']}%)\n"
+                f"Volume Ratio: {ta['metrics']['volume_ratio']}, Recent Return: {ta['metrics']['recent_return']}\n"
+                f"Bullish: {ta['metrics']['bullish_signals']}, Bearish: {ta['metrics']['bearish_signals']} (Weight: {ta['metrics']['weight']})\n\n"
+                # Market Activity
+                f"Market Activity: {ma['signal'].upper()} ({ma['confidence']}%)\n"
+                f"Total Events: {ma['metrics']['total_events']} (Bullish: {ma['metrics']['bullish_events']}, Bearish: {ma['metrics']['bearish_events']}, Neutral: {ma['metrics']['neutral_events']})\n"
+                f"Weight: {ma['metrics']['weight']}\n\n"
+                # Volatility Sentiment
+                f"Volatility Sentiment: {vs['signal'].upper()} ({vs['confidence']}%)\n"
+                f"7-day Volatility: {vs['metrics']['volatility_7d']}\n"
+                f"Bullish: {vs['metrics']['bullish_signals']}, Bearish: {vs['metrics']['bearish_signals']} (Weight: {vs['metrics']['weight']})\n\n"
+                # Combined Analysis
+                f"Combined Analysis:\n"
+                f"Total Weighted Bullish: {ca['total_weighted_bullish']}, Total Weighted Bearish: {ca['total_weighted_bearish']}\n"
+                f"{ca['signal_determination']}"
+            )
+            progress.update_status(agent_id, ticker, "Done", analysis=reasoning_text)
+        else:
+            progress.update_status(agent_id, ticker, "Done")
 
     # Create the sentiment message
     message = HumanMessage(
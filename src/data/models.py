@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict
 
 
 class Price(BaseModel):
+    # Constructed in bulk when parsing klines; frozen keeps instances
+    # hashable/shareable across the per-run caches and skips the
+    # mutation bookkeeping pydantic does for mutable models
+    model_config = ConfigDict(frozen=True)
+
     open: float
     close: float
     high: float
@@ -10,12 +16,26 @@ class Price(BaseModel):
     time: str
 
 
+# Column-oriented (structure-of-arrays) dtype for bulk price flows. Numeric
+# consumers that only need whole columns read these instead of iterating a
+# list of Price objects row by row.
+PRICE_DTYPE = np.dtype([
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+
 class PriceResponse(BaseModel):
     ticker: str
     prices: list[Price]
 
 
 class FinancialMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     report_period: str
     period: str
@@ -100,6 +120,8 @@ class InsiderTradeResponse(BaseModel):
 
 
 class CompanyNews(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     title: str
     author: str
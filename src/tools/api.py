@@ -1,11 +1,23 @@
 import datetime
 from datetime import timedelta
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 import os
+
+from dateutil import tz
+import numpy as np
 import pandas as pd
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
+from pydantic import TypeAdapter
+
 from src.data.cache import get_cache
+from src.utils.serialization import from_json
 from src.data.models import (
     CompanyNews,
     CompanyNewsResponse,
@@ -13,6 +25,7 @@ from src.data.models import (
     FinancialMetricsResponse,
     Price,
     PriceResponse,
+    PRICE_DTYPE,
     LineItem,
     LineItemResponse,
     InsiderTrade,
@@ -20,12 +33,147 @@ from src.data.models import (
     CompanyFactsResponse,
 )
 
+
+# Bulk list validators: TypeAdapter validates a whole list of dicts in one
+# C-level pass instead of paying per-instance constructor overhead
+_PRICE_LIST = TypeAdapter(list[Price])
+_METRICS_LIST = TypeAdapter(list[FinancialMetrics])
+_LINE_ITEM_LIST = TypeAdapter(list[LineItem])
+_INSIDER_TRADE_LIST = TypeAdapter(list[InsiderTrade])
+_NEWS_LIST = TypeAdapter(list[CompanyNews])
+
 # Global cache instance
 _cache = get_cache()
 
+# Per-process memos of already-validated model lists, keyed by the same cache
+# keys as _cache. The shared cache stores plain dicts, so every hit used to
+# re-run pydantic validation over the whole list; these memos return the
+# validated objects directly for repeated calls within one process.
+_validated_prices: dict[str, list] = {}
+_validated_news: dict[str, list] = {}
+
 # Binance API Configuration
 BINANCE_BASE_URL = "https://api.binance.com"
 
+# Endpoint URLs, built once instead of re-formatted per call
+BINANCE_KLINES_URL = f"{BINANCE_BASE_URL}/api/v3/klines"
+BINANCE_TICKER_24H_URL = f"{BINANCE_BASE_URL}/api/v3/ticker/24hr"
+BINANCE_TRADES_URL = f"{BINANCE_BASE_URL}/api/v3/trades"
+
+# Binance request-weight budget per minute; used to back off proactively
+# before the server starts answering 429
+_BINANCE_WEIGHT_LIMIT_1M = 1200
+
+# Module-level session so TCP/TLS connections are reused across requests
+# instead of paying a fresh handshake per call; sized for the thread-pool
+# fetch phases in the agents
+_session = requests.Session()
+_session.headers["User-Agent"] = "AgentVest/1.0"
+# 1000-row klines bodies are ~100KB of JSON; ask for compressed transfer
+# explicitly (brotli only when a decoder is importable, since requests
+# cannot decode br without one)
+try:
+    import brotli  # noqa: F401
+    _session.headers["Accept-Encoding"] = "gzip, br"
+except ImportError:
+    _session.headers["Accept-Encoding"] = "gzip"
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Shared executor for helpers that issue independent Binance calls (e.g.
+# klines plus 24hr ticker); module scope avoids re-spawning threads per call
+_executor = ThreadPoolExecutor(max_workers=8)
+
+
+# HTTP-level response cache for conditional GETs, keyed by (url, params).
+# Entries within the TTL are served without touching the network at all; past
+# the TTL the request is revalidated with If-None-Match/If-Modified-Since so a
+# 304 costs no body transfer or JSON re-parse. The TTL is short because the
+# main user is the 24hr rolling ticker, which is cheap to serve slightly stale
+# but expensive to refetch per agent.
+_http_cache: dict = {}
+_HTTP_CACHE_TTL = 30.0  # seconds
+
+
+def _conditional_get(url: str, params: dict = None, ttl: float = _HTTP_CACHE_TTL) -> requests.Response:
+    """GET with a short-TTL cache and ETag/Last-Modified revalidation."""
+    key = (url, tuple(sorted(params.items())) if params else None)
+    entry = _http_cache.get(key)
+    now = time.monotonic()
+    if entry and now - entry["fetched_at"] < ttl:
+        return entry["response"]
+
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = _make_api_request(url, headers=headers, params=params)
+
+    if entry and response.status_code == 304:
+        # Unchanged upstream: bump freshness and reuse the parsed response
+        entry["fetched_at"] = now
+        return entry["response"]
+    if response.status_code == 200:
+        _http_cache[key] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": now,
+            "response": response,
+        }
+    return response
+
+
+# Parsed-payload memo layered over the HTTP cache, so repeated 24hr ticker
+# lookups for one symbol within the TTL skip the JSON parse as well as the
+# network round trip. Several helpers want this ticker for the same symbol
+# in a single analysis run.
+_ticker_memo: dict[str, tuple[float, int, dict]] = {}
+
+
+def _get_24hr_ticker(symbol: str) -> tuple[int, dict]:
+    """Fetch and parse the 24hr ticker for a symbol, memoized for the TTL.
+
+    Returns (status_code, payload); the payload is {} on a non-200 answer.
+    """
+    sym = symbol.upper()
+    entry = _ticker_memo.get(sym)
+    now = time.monotonic()
+    if entry and now - entry[0] < _HTTP_CACHE_TTL:
+        return entry[1], entry[2]
+
+    response = _conditional_get(BINANCE_TICKER_24H_URL, params={"symbol": sym})
+    if response.status_code != 200:
+        return response.status_code, {}
+    data = from_json(response.content)
+    _ticker_memo[sym] = (now, 200, data)
+    return 200, data
+
+
+def _k(*parts) -> int:
+    """Build a fixed-size cache key from the given parts.
+
+    Cache keys used to be long formatted strings that Python re-hashes in
+    full on every dict lookup; a 64-bit blake2b digest keeps the key O(1) to
+    hash and compare no matter how many parts go into it.
+    """
+    digest = hashlib.blake2b("|".join(str(p) for p in parts).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big")
+
+
+@functools.lru_cache(maxsize=512)
+def _ymd_to_ms(date_str: str) -> int:
+    """Convert a YYYY-MM-DD date string to epoch milliseconds.
+
+    The same handful of start/end dates is parsed over and over across the
+    helpers in a run, so the result is memoized; fromisoformat is also much
+    faster than strptime for this fixed format.
+    """
+    return int(datetime.datetime.fromisoformat(date_str).timestamp() * 1000)
+
 
 def _make_api_request(url: str, headers: dict = None, method: str = "GET", json_data: dict = None, params: dict = None, max_retries: int = 3) -> requests.Response:
     """
@@ -50,17 +198,30 @@ def _make_api_request(url: str, headers: dict = None, method: str = "GET", json_
         
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = _session.post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers, params=params)
+            response = _session.get(url, headers=headers, params=params)
         
         if response.status_code == 429 and attempt < max_retries:
-            # Linear backoff: 60s, 90s, 120s, 150s...
-            delay = 60 + (30 * attempt)
-            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
+            # Exponential backoff with jitter so synchronized clients don't
+            # retry in lockstep; honor the server's Retry-After when present
+            # (numeric form only — the HTTP-date form falls back to the
+            # exponential delay)
+            retry_after_header = response.headers.get("Retry-After")
+            retry_after = int(retry_after_header) if retry_after_header and str(retry_after_header).isdigit() else 0
+            base = max(retry_after, min(60 * 2 ** attempt, 600))
+            delay = base * random.uniform(0.5, 1.5)
+            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay:.0f}s before retrying...")
             time.sleep(delay)
             continue
-        
+
+        # Binance reports request-weight consumption per response; pause
+        # briefly when close to the per-minute budget so the next call does
+        # not land on a 429
+        used_weight = response.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used_weight and str(used_weight).isdigit() and int(used_weight) > 0.8 * _BINANCE_WEIGHT_LIMIT_1M:
+            time.sleep(1)
+
         # Return the response (whether success, other errors, or final 429)
         return response
 
@@ -83,15 +244,19 @@ def get_prices(symbol: str, start_date: str, end_date: str, interval: str = "1d"
         list[Price]: List of Price objects containing OHLCV data
     """
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{symbol}_{start_date}_{end_date}_{interval}"
+    cache_key = _k("prices", symbol, start_date, end_date, interval)
     
-    # Check cache first - simple exact match
+    # Check the validated-model memo first, then the shared dict cache
+    if (memoized := _validated_prices.get(cache_key)) is not None:
+        return memoized
     if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+        prices = _PRICE_LIST.validate_python(cached_data)
+        _validated_prices[cache_key] = prices
+        return prices
 
     # Convert date strings to timestamps (milliseconds)
-    start_timestamp = int(datetime.datetime.strptime(start_date, "%Y-%m-%d").timestamp() * 1000)
-    end_timestamp = int(datetime.datetime.strptime(end_date, "%Y-%m-%d").timestamp() * 1000)
+    start_timestamp = _ymd_to_ms(start_date)
+    end_timestamp = _ymd_to_ms(end_date)
 
     # Prepare request parameters
     params = {
@@ -102,34 +267,39 @@ def get_prices(symbol: str, start_date: str, end_date: str, interval: str = "1d"
         "limit": 1000  # Max limit per request
     }
 
-    url = f"{BINANCE_BASE_URL}/api/v3/klines"
-    response = _make_api_request(url, headers={}, params=params)
+    response = _make_api_request(BINANCE_KLINES_URL, headers={}, params=params)
     
     if response.status_code != 200:
         raise Exception(f"Error fetching data: {symbol} - {response.status_code} - {response.text}")
 
     # Parse Binance klines response
     # Format: [open_time, open, high, low, close, volume, close_time, quote_volume, trades, taker_buy_base, taker_buy_quote, ignore]
-    klines_data = response.json()
+    klines_data = from_json(response.content)
     
     if not klines_data:
         return []
 
-    # Convert Binance klines to Price objects
-    prices = []
-    for kline in klines_data:
-        price = Price(
-            open=float(kline[1]),
-            high=float(kline[2]),
-            low=float(kline[3]),
-            close=float(kline[4]),
-            volume=int(float(kline[5])),
-            time=datetime.datetime.fromtimestamp(kline[0] / 1000).strftime("%Y-%m-%d %H:%M:%S")
-        )
-        prices.append(price)
+    # Convert Binance klines to Price objects. The OHLCV columns are cast in
+    # one vectorized astype and the timestamps formatted in one pandas pass
+    # (converted to local time to match datetime.fromtimestamp) instead of
+    # parsing and formatting row by row.
+    arr = np.array(klines_data, dtype=object)
+    ohlcv = arr[:, 1:6].astype(np.float64)
+    times = (
+        pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms", utc=True)
+        .tz_convert(tz.tzlocal())
+        .strftime("%Y-%m-%d %H:%M:%S")
+    )
+    price_dicts = [
+        {"open": o, "high": h, "low": l, "close": c, "volume": int(v), "time": t}
+        for (o, h, l, c, v), t in zip(ohlcv.tolist(), times)
+    ]
+    prices = _PRICE_LIST.validate_python(price_dicts)
 
-    # Cache the results using the comprehensive cache key
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
+    # Cache the field dicts we just validated from instead of re-emitting
+    # them with model_dump() row by row
+    _cache.set_prices(cache_key, price_dicts)
+    _validated_prices[cache_key] = prices
     return prices
 
 
@@ -159,41 +329,48 @@ def get_financial_metrics(
     For historical data, consider using additional Binance endpoints.
     """
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{symbol}_{period}_{end_date}_{limit}"
+    cache_key = _k("metrics", symbol, period, end_date, limit)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
+        return _METRICS_LIST.validate_python(cached_data)
 
-    # Prepare request parameters
-    params = {
-        "symbol": symbol.upper()
-    }
+    # Fetch through the shared (memoized) 24hr ticker path
+    status, ticker_data = _get_24hr_ticker(symbol)
 
-    url = f"{BINANCE_BASE_URL}/api/v3/ticker/24hr"
-    response = _make_api_request(url, headers={}, params=params)
-    
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {symbol} - {response.status_code} - {response.text}")
+    if status != 200:
+        raise Exception(f"Error fetching data: {symbol} - {status}")
 
-    # Parse Binance 24hr ticker response
-    ticker_data = response.json()
-    
     if not ticker_data:
         return []
 
+    metric_fields = _ticker_to_metric_fields(ticker_data, symbol, end_date, period)
+    financial_metrics = [FinancialMetrics(**metric_fields)]
+
+    # Cache the field dicts directly using the comprehensive cache key
+    _cache.set_financial_metrics(cache_key, [metric_fields])
+    return financial_metrics
+
+
+def _ticker_to_metric_fields(ticker_data: dict, symbol: str, end_date: str, period: str) -> dict:
+    """Convert a Binance 24hr ticker dict to FinancialMetrics field values.
+
+    Returns the plain field dict so callers can validate it once with
+    FinancialMetrics(**fields) and cache the same dict directly, instead of
+    dumping the model back out again.
+    """
     # Convert Binance 24hr stats to FinancialMetrics format
     # Map crypto metrics to stock metrics equivalents
     current_price = float(ticker_data.get('lastPrice', 0))
     volume = float(ticker_data.get('volume', 0))
     quote_volume = float(ticker_data.get('quoteVolume', 0))
     price_change_percent = float(ticker_data.get('priceChangePercent', 0))
-    
+
     # Calculate approximate market cap (for major coins, you'd need additional data)
     # This is a simplified calculation
     market_cap = current_price * volume if volume > 0 else None
-    
-    financial_metric = FinancialMetrics(
+
+    return dict(
         ticker=symbol,
         report_period=str(end_date),
         period=period,
@@ -228,11 +405,69 @@ def get_financial_metrics(
         interest_coverage=None,  # N/A for crypto
     )
 
-    financial_metrics = [financial_metric]
 
-    # Cache the results as dicts using the comprehensive cache key
-    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
-    return financial_metrics
+def get_all_24h_stats(
+    symbols: list[str],
+    end_date: str,
+    period: str = "24h",
+    limit: int = 1,
+    api_key: str = None,
+) -> dict[str, list[FinancialMetrics]]:
+    """
+    Fetch 24hr market metrics for several symbols in a single request.
+
+    Binance Endpoint: /api/v3/ticker/24hr (with the `symbols` batch parameter)
+
+    Collapses the N per-symbol round trips of get_financial_metrics into one
+    HTTP call; symbols already in the cache are served from it and excluded
+    from the request.
+
+    Args:
+        symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+        end_date: End date (used for cache key, Binance returns current 24h data)
+        period: Period indicator (default: '24h', used for compatibility)
+        limit: Limit (used for cache key, matches get_financial_metrics)
+        api_key: Optional API key (not required for public endpoints)
+
+    Returns:
+        dict[str, list[FinancialMetrics]]: Per-symbol metrics, keyed by symbol
+    """
+    stats_by_symbol: dict[str, list[FinancialMetrics]] = {}
+
+    # Serve whatever is already cached; only fetch the rest
+    missing = []
+    for symbol in symbols:
+        cache_key = _k("metrics", symbol, period, end_date, limit)
+        if cached_data := _cache.get_financial_metrics(cache_key):
+            stats_by_symbol[symbol] = _METRICS_LIST.validate_python(cached_data)
+        else:
+            missing.append(symbol)
+
+    if not missing:
+        return stats_by_symbol
+
+    # Binance expects the batch parameter as a JSON array without spaces
+    params = {
+        "symbols": "[" + ",".join(f'"{s.upper()}"' for s in missing) + "]"
+    }
+
+    response = _make_api_request(BINANCE_TICKER_24H_URL, headers={}, params=params)
+
+    if response.status_code != 200:
+        raise Exception(f"Error fetching data: {missing} - {response.status_code} - {response.text}")
+
+    by_upper = {s.upper(): s for s in missing}
+    for ticker_data in from_json(response.content):
+        symbol = by_upper.get(ticker_data.get("symbol", ""))
+        if symbol is None:
+            continue
+        metric_fields = _ticker_to_metric_fields(ticker_data, symbol, end_date, period)
+        stats_by_symbol[symbol] = [FinancialMetrics(**metric_fields)]
+        # Populate the per-symbol cache so later get_financial_metrics calls hit it
+        cache_key = _k("metrics", symbol, period, end_date, limit)
+        _cache.set_financial_metrics(cache_key, [metric_fields])
+
+    return stats_by_symbol
 
 
 def search_line_items(
@@ -266,14 +501,14 @@ def search_line_items(
         list[LineItem]: List of crypto-equivalent metrics
     """
     # Cache key
-    cache_key = f"{symbol}_line_items_{end_date}_{period}_{limit}"
+    cache_key = _k("line_items", symbol, end_date, period, limit)
     
     # Check cache
     if cached_data := _cache.get_line_items(cache_key):
-        return [LineItem(**item) for item in cached_data]
+        return _LINE_ITEM_LIST.validate_python(cached_data)
     
     # Get historical klines data for trend analysis
-    end_timestamp = int(datetime.datetime.strptime(end_date, "%Y-%m-%d").timestamp() * 1000)
+    end_timestamp = _ymd_to_ms(end_date)
     
     # Calculate start date based on limit (get historical data)
     days_back = limit * (30 if period == "annual" else 7 if period == "ttm" else 1)
@@ -287,55 +522,82 @@ def search_line_items(
         "limit": min(limit * 30, 1000)
     }
     
-    url = f"{BINANCE_BASE_URL}/api/v3/klines"
-    response = _make_api_request(url, headers={}, params=params)
-    
+    # The klines history and the 24hr ticker are independent requests, so
+    # fire both at once instead of serializing the round trips; the ticker
+    # goes through the shared memoized path
+    klines_future = _executor.submit(_make_api_request, BINANCE_KLINES_URL, headers={}, params=params)
+    ticker_future = _executor.submit(_get_24hr_ticker, symbol)
+    response = klines_future.result()
+    ticker_status, ticker_data = ticker_future.result()
+
     if response.status_code != 200:
         print(f"Warning: Could not fetch historical data for line items: {response.status_code}")
         return []
-    
-    klines_data = response.json()
+
+    klines_data = from_json(response.content)
     if not klines_data:
         return []
-    
-    # Also get 24hr ticker for current metrics
-    ticker_params = {"symbol": symbol.upper()}
-    ticker_url = f"{BINANCE_BASE_URL}/api/v3/ticker/24hr"
-    ticker_response = _make_api_request(ticker_url, headers={}, params=ticker_params)
-    
-    ticker_data = {}
-    if ticker_response.status_code == 200:
-        ticker_data = ticker_response.json()
-    
-    # Process klines into periods
-    line_item_list = []
+
+    # Process klines into periods. All per-period aggregates are computed in
+    # one vectorized pass: cast the numeric columns once, then reduce over the
+    # period boundaries (reduceat treats a short trailing period the same way
+    # the old per-slice loop did).
+    line_item_dicts = []
     period_size = 30 if period == "annual" else 7 if period == "ttm" else 1
-    
-    for i in range(0, min(len(klines_data), limit * period_size), period_size):
-        period_klines = klines_data[i:i+period_size]
-        if not period_klines:
-            continue
-            
-        # Calculate metrics for this period
-        period_volume = sum(float(k[5]) for k in period_klines)  # Base asset volume
-        period_quote_volume = sum(float(k[7]) for k in period_klines)  # Quote asset volume
-        period_trades = sum(int(k[8]) for k in period_klines)  # Number of trades
-        
-        open_price = float(period_klines[0][1])
-        close_price = float(period_klines[-1][4])
-        high_price = max(float(k[2]) for k in period_klines)
-        low_price = min(float(k[3]) for k in period_klines)
-        
+    n_rows = min(len(klines_data), limit * period_size)
+
+    arr = np.array(klines_data[:n_rows], dtype=object)
+    open_ms = arr[:, 0].astype(np.int64)
+    # Columns: open, high, low, close, base volume, quote volume, trades
+    cols = arr[:, [1, 2, 3, 4, 5, 7, 8]].astype(np.float64)
+
+    starts = np.arange(0, n_rows, period_size)
+    ends = np.append(starts[1:], n_rows)
+
+    if period_size == 1:
+        # Specialized path for single-row periods: every reduction is the
+        # identity, so the column views are the per-period aggregates and
+        # reduceat's per-segment overhead can be skipped entirely
+        period_volumes = cols[:, 4]  # Base asset volume
+        period_quote_volumes = cols[:, 5]  # Quote asset volume
+        period_trades = cols[:, 6]  # Number of trades
+        open_prices = cols[:, 0]
+        close_prices = cols[:, 3]
+        high_prices = cols[:, 1]
+        low_prices = cols[:, 2]
+    else:
+        period_volumes = np.add.reduceat(cols[:, 4], starts)  # Base asset volume
+        period_quote_volumes = np.add.reduceat(cols[:, 5], starts)  # Quote asset volume
+        period_trades = np.add.reduceat(cols[:, 6], starts)  # Number of trades
+        open_prices = cols[starts, 0]
+        close_prices = cols[ends - 1, 3]
+        high_prices = np.maximum.reduceat(cols[:, 1], starts)
+        low_prices = np.minimum.reduceat(cols[:, 2], starts)
+
+    # Period labels come from the last kline of each period
+    period_dates = (
+        pd.to_datetime(open_ms[ends - 1], unit="ms", utc=True)
+        .tz_convert(tz.tzlocal())
+        .strftime("%Y-%m-%d")
+    )
+
+    for p in range(starts.size):
+        period_volume = float(period_volumes[p])
+        period_quote_volume = float(period_quote_volumes[p])
+
+        open_price = float(open_prices[p])
+        close_price = float(close_prices[p])
+
         price_change = close_price - open_price
         price_change_pct = (price_change / open_price * 100) if open_price > 0 else 0
-        
+
         # Approximate market cap (price * volume as proxy)
         approx_market_cap = close_price * period_volume if period_volume > 0 else 0
-        
-        period_date = datetime.datetime.fromtimestamp(period_klines[-1][0] / 1000).strftime("%Y-%m-%d")
-        
+
+        period_date = period_dates[p]
+
         # Create line item with crypto-equivalent metrics
-        line_item = LineItem(
+        item_fields = dict(
             ticker=symbol,
             report_period=period_date,
             period=period,
@@ -383,11 +645,13 @@ def search_line_items(
             cash_and_equivalents=approx_market_cap * 0.7,  # High liquidity
         )
         
-        line_item_list.append(line_item)
-    
-    # Cache the results
-    _cache.set_line_items(cache_key, [item.model_dump() for item in line_item_list])
-    
+        line_item_dicts.append(item_fields)
+
+    line_item_list = _LINE_ITEM_LIST.validate_python(line_item_dicts)
+
+    # Cache the field dicts we validated from
+    _cache.set_line_items(cache_key, line_item_dicts)
+
     return line_item_list
 
 
@@ -415,11 +679,11 @@ def get_insider_trades(
         list[InsiderTrade]: List of large trades (whale activity)
     """
     # Cache key
-    cache_key = f"{symbol}_whale_trades_{start_date}_{end_date}_{limit}"
+    cache_key = _k("whale_trades", symbol, start_date, end_date, limit)
     
     # Check cache
     if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+        return _INSIDER_TRADE_LIST.validate_python(cached_data)
     
     # Get recent trades
     params = {
@@ -427,14 +691,13 @@ def get_insider_trades(
         "limit": min(limit, 1000)
     }
     
-    url = f"{BINANCE_BASE_URL}/api/v3/trades"
-    response = _make_api_request(url, headers={}, params=params)
+    response = _make_api_request(BINANCE_TRADES_URL, headers={}, params=params)
     
     if response.status_code != 200:
         print(f"Warning: Could not fetch whale trades: {response.status_code}")
         return []
     
-    trades_data = response.json()
+    trades_data = from_json(response.content)
     if not trades_data:
         return []
     
@@ -446,7 +709,7 @@ def get_insider_trades(
     whale_threshold = avg_size * 10
     
     # Filter for whale trades
-    insider_trades_list = []
+    trade_dicts = []
     for trade in trades_data:
         trade_qty = float(trade['qty'])
         trade_price = float(trade['price'])
@@ -460,7 +723,7 @@ def get_insider_trades(
             is_buyer_maker = trade.get('isBuyerMaker', False)
             transaction_type = "Sell" if is_buyer_maker else "Buy"
             
-            insider_trade = InsiderTrade(
+            trade_fields = dict(
                 ticker=symbol,
                 issuer=f"Whale_{str(trade['id'])[-6:]}",  # Anonymous whale ID
                 name=None,  # Anonymous
@@ -475,15 +738,18 @@ def get_insider_trades(
                 security_title=transaction_type,  # Buy or Sell
                 filing_date=trade_time.strftime("%Y-%m-%d"),
             )
-            insider_trades_list.append(insider_trade)
-    
+            trade_dicts.append(trade_fields)
+
     # Sort by transaction value (largest first)
-    insider_trades_list.sort(key=lambda x: x.transaction_value, reverse=True)
-    
-    # Cache the results
-    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in insider_trades_list[:limit]])
-    
-    return insider_trades_list[:limit]
+    trade_dicts.sort(key=lambda d: d["transaction_value"], reverse=True)
+    trade_dicts = trade_dicts[:limit]
+
+    insider_trades_list = _INSIDER_TRADE_LIST.validate_python(trade_dicts)
+
+    # Cache the field dicts we validated from
+    _cache.set_insider_trades(cache_key, trade_dicts)
+
+    return insider_trades_list
 
 
 def get_company_news(
@@ -513,27 +779,21 @@ def get_company_news(
         list[CompanyNews]: List of market activity insights formatted as news
     """
     # Create a cache key
-    cache_key = f"{symbol}_news_{start_date or 'none'}_{end_date}_{limit}"
+    cache_key = _k("news", symbol, start_date or "none", end_date, limit)
     
-    # Check cache
+    # Check the validated-model memo first, then the shared dict cache
+    if (memoized := _validated_news.get(cache_key)) is not None:
+        return memoized
     if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
-
-    # Get 24hr ticker for current market state
-    ticker_params = {"symbol": symbol.upper()}
-    ticker_url = f"{BINANCE_BASE_URL}/api/v3/ticker/24hr"
-    ticker_response = _make_api_request(ticker_url, headers={}, params=ticker_params)
-    
-    if ticker_response.status_code != 200:
-        print(f"Warning: Could not fetch market data for news: {ticker_response.status_code}")
-        return []
+        news_list = _NEWS_LIST.validate_python(cached_data)
+        _validated_news[cache_key] = news_list
+        return news_list
 
-    ticker_data = ticker_response.json()
-    
-    # Get recent klines for trend analysis
-    end_timestamp = int(datetime.datetime.strptime(end_date, "%Y-%m-%d").timestamp() * 1000)
+    # 24hr ticker for current market state and recent klines for trend
+    # analysis are independent requests; fire both at once
+    end_timestamp = _ymd_to_ms(end_date)
     start_timestamp = end_timestamp - (30 * 24 * 60 * 60 * 1000)  # Last 30 days
-    
+
     klines_params = {
         "symbol": symbol.upper(),
         "interval": "1d",
@@ -541,16 +801,22 @@ def get_company_news(
         "endTime": end_timestamp,
         "limit": 30
     }
-    
-    klines_url = f"{BINANCE_BASE_URL}/api/v3/klines"
-    klines_response = _make_api_request(klines_url, headers={}, params=klines_params)
-    
+
+    ticker_future = _executor.submit(_get_24hr_ticker, symbol)
+    klines_future = _executor.submit(_make_api_request, BINANCE_KLINES_URL, headers={}, params=klines_params)
+    ticker_status, ticker_data = ticker_future.result()
+    klines_response = klines_future.result()
+
+    if ticker_status != 200:
+        print(f"Warning: Could not fetch market data for news: {ticker_status}")
+        return []
+
     klines_data = []
     if klines_response.status_code == 200:
-        klines_data = klines_response.json()
+        klines_data = from_json(klines_response.content)
     
     # Generate market insights as "news"
-    company_news_list = []
+    news_dicts = []
     current_time = datetime.datetime.now()
     
     # Extract key metrics
@@ -566,7 +832,7 @@ def get_company_news(
     # 1. Price Action News
     if abs(price_change_pct) > 5:
         direction = "Surges" if price_change_pct > 0 else "Drops"
-        news_item = CompanyNews(
+        news_item = dict(
             ticker=symbol,
             title=f"{symbol} {direction} {abs(price_change_pct):.2f}% in 24H Trading",
             author="Market Analysis",
@@ -574,12 +840,12 @@ def get_company_news(
             date=(current_time - timedelta(hours=2)).strftime("%Y-%m-%d %H:%M:%S"),
             url=f"https://www.binance.com/en/trade/{symbol}"
         )
-        company_news_list.append(news_item)
+        news_dicts.append(news_item)
     
     # 2. Volume Analysis News
     if quote_volume > 0:
         volume_intensity = "High" if trades_count > 100000 else "Moderate" if trades_count > 50000 else "Low"
-        news_item = CompanyNews(
+        news_item = dict(
             ticker=symbol,
             title=f"{symbol} Shows {volume_intensity} Trading Activity: ${quote_volume:,.0f} Volume",
             author="Market Analysis",
@@ -587,13 +853,13 @@ def get_company_news(
             date=(current_time - timedelta(hours=4)).strftime("%Y-%m-%d %H:%M:%S"),
             url=f"https://www.binance.com/en/trade/{symbol}"
         )
-        company_news_list.append(news_item)
+        news_dicts.append(news_item)
     
     # 3. Volatility News
     if high_24h > 0 and low_24h > 0:
         volatility_pct = ((high_24h - low_24h) / low_24h * 100)
         if volatility_pct > 10:
-            news_item = CompanyNews(
+            news_item = dict(
                 ticker=symbol,
                 title=f"{symbol} Experiences {volatility_pct:.1f}% Intraday Volatility",
                 author="Market Analysis",
@@ -601,7 +867,7 @@ def get_company_news(
                 date=(current_time - timedelta(hours=6)).strftime("%Y-%m-%d %H:%M:%S"),
                 url=f"https://www.binance.com/en/trade/{symbol}"
             )
-            company_news_list.append(news_item)
+            news_dicts.append(news_item)
     
     # 4. Trend Analysis from klines
     if len(klines_data) >= 7:
@@ -612,7 +878,7 @@ def get_company_news(
         
         if abs(weekly_change) > 15:
             trend = "Uptrend" if weekly_change > 0 else "Downtrend"
-            news_item = CompanyNews(
+            news_item = dict(
                 ticker=symbol,
                 title=f"{symbol} in Strong {trend}: {abs(weekly_change):.1f}% Weekly Movement",
                 author="Technical Analysis",
@@ -620,7 +886,7 @@ def get_company_news(
                 date=(current_time - timedelta(hours=8)).strftime("%Y-%m-%d %H:%M:%S"),
                 url=f"https://www.binance.com/en/trade/{symbol}"
             )
-            company_news_list.append(news_item)
+            news_dicts.append(news_item)
     
     # 5. Support/Resistance Levels
     if len(klines_data) >= 14:
@@ -633,7 +899,7 @@ def get_company_news(
         distance_to_support = ((last_price - support) / last_price * 100)
         
         if distance_to_resistance < 5:
-            news_item = CompanyNews(
+            news_item = dict(
                 ticker=symbol,
                 title=f"{symbol} Approaches Key Resistance at ${resistance:.2f}",
                 author="Technical Analysis",
@@ -641,10 +907,10 @@ def get_company_news(
                 date=(current_time - timedelta(hours=10)).strftime("%Y-%m-%d %H:%M:%S"),
                 url=f"https://www.binance.com/en/trade/{symbol}"
             )
-            company_news_list.append(news_item)
+            news_dicts.append(news_item)
         
         if distance_to_support < 5:
-            news_item = CompanyNews(
+            news_item = dict(
                 ticker=symbol,
                 title=f"{symbol} Near Support Level at ${support:.2f}",
                 author="Technical Analysis",
@@ -652,12 +918,12 @@ def get_company_news(
                 date=(current_time - timedelta(hours=12)).strftime("%Y-%m-%d %H:%M:%S"),
                 url=f"https://www.binance.com/en/trade/{symbol}"
             )
-            company_news_list.append(news_item)
+            news_dicts.append(news_item)
     
     # 6. Market Sentiment
     if price_change_pct > 0 and volume > 0:
         sentiment = "Bullish" if price_change_pct > 3 else "Cautiously Optimistic"
-        news_item = CompanyNews(
+        news_item = dict(
             ticker=symbol,
             title=f"Market Sentiment for {symbol} Turns {sentiment}",
             author="Sentiment Analysis",
@@ -665,10 +931,10 @@ def get_company_news(
             date=(current_time - timedelta(hours=14)).strftime("%Y-%m-%d %H:%M:%S"),
             url=f"https://www.binance.com/en/trade/{symbol}"
         )
-        company_news_list.append(news_item)
+        news_dicts.append(news_item)
     elif price_change_pct < 0:
         sentiment = "Bearish" if price_change_pct < -3 else "Cautious"
-        news_item = CompanyNews(
+        news_item = dict(
             ticker=symbol,
             title=f"{sentiment} Pressure Observed on {symbol}",
             author="Sentiment Analysis",
@@ -676,38 +942,14 @@ def get_company_news(
             date=(current_time - timedelta(hours=14)).strftime("%Y-%m-%d %H:%M:%S"),
             url=f"https://www.binance.com/en/trade/{symbol}"
         )
-        company_news_list.append(news_item)
-    
-    # Cache the results
-    _cache.set_company_news(cache_key, [news.model_dump() for news in company_news_list[:limit]])
+        news_dicts.append(news_item)
     
-    return company_news_list[:limit]
+    # Trim, validate once, and cache the same field dicts
+    news_dicts = news_dicts[:limit]
+    company_news_list = _NEWS_LIST.validate_python(news_dicts)
+    _cache.set_company_news(cache_key, news_dicts)
+    _validated_news[cache_key] = company_news_list
 
-    # Convert recent trades to CompanyNews format for compatibility
-    # This is a workaround since crypto doesn't have traditional news
-    company_news_list = []
-    for trade in trades_data[:limit]:
-        # Convert timestamp to date string
-        trade_time = datetime.datetime.fromtimestamp(trade['time'] / 1000)
-        
-        # Create a news-like summary of the trade
-        price = float(trade['price'])
-        qty = float(trade['qty'])
-        is_buyer_maker = trade['isBuyerMaker']
-        side = "SELL" if is_buyer_maker else "BUY"
-        
-        news_item = CompanyNews(
-            ticker=symbol,
-            title=f"Trade Activity: {side} {qty:.4f} @ ${price:.2f}",
-            author="Binance Exchange",
-            source="Binance",
-            date=trade_time.strftime("%Y-%m-%d %H:%M:%S"),
-            url=f"https://www.binance.com/en/trade/{symbol}"
-        )
-        company_news_list.append(news_item)
-
-    # Cache the results using the comprehensive cache key
-    _cache.set_company_news(cache_key, [news.model_dump() for news in company_news_list])
     return company_news_list
 
 
@@ -732,32 +974,21 @@ def get_market_cap(
     Returns:
         float | None: Estimated market cap based on 24hr volume and price
     """
-    # Prepare request parameters
-    params = {
-        "symbol": symbol.upper()
-    }
+    # get_financial_metrics computes the same price * volume estimate from
+    # the same 24hr ticker payload and already caches per symbol/date, so
+    # route through it instead of fetching separately
+    try:
+        metrics = get_financial_metrics(symbol, end_date, api_key=api_key)
+    except Exception as e:
+        print(f"Error fetching market cap: {symbol} - {e}")
+        return None
 
-    url = f"{BINANCE_BASE_URL}/api/v3/ticker/24hr"
-    response = _make_api_request(url, headers={}, params=params)
-    
-    if response.status_code != 200:
-        print(f"Error fetching market cap: {symbol} - {response.status_code}")
+    if not metrics:
         return None
 
-    ticker_data = response.json()
-    
-    # Calculate approximate market cap using price * volume
-    # Note: This is a rough estimate, not actual circulating supply market cap
-    last_price = float(ticker_data.get('lastPrice', 0))
-    volume = float(ticker_data.get('volume', 0))
-    
-    if last_price > 0 and volume > 0:
-        # This is a simplified calculation
-        # For real market cap, you'd need circulating supply data
-        estimated_market_cap = last_price * volume
-        return estimated_market_cap
-    
-    return None
+    # market_cap is None when no volume was reported; also treat a zero
+    # estimate (no price) as unavailable, matching the old behavior
+    return metrics[0].market_cap or None
 
 
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
@@ -770,16 +1001,57 @@ def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame with OHLCV data indexed by date
     """
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
+    # Binance returns klines already in ascending time, so a single
+    # monotonic scan usually replaces the full multi-column sort below;
+    # out-of-order input falls back to one key-based Timsort pass
+    if not all(prices[i].time <= prices[i + 1].time for i in range(len(prices) - 1)):
+        prices = sorted(prices, key=attrgetter("time"))
+
+    # Attribute tuples go straight into from_records, skipping the per-Price
+    # model_dump() dict allocation the old construction paid
+    df = pd.DataFrame.from_records(
+        [(p.open, p.close, p.high, p.low, p.volume, p.time) for p in prices],
+        columns=["open", "close", "high", "low", "volume", "time"],
+    )
+    # An explicit format keeps pandas on its C parse path (no per-row format
+    # inference), and cache=True memoizes repeated timestamps across symbols
+    df.index = pd.DatetimeIndex(
+        pd.to_datetime(df["time"], format="%Y-%m-%d %H:%M:%S", cache=True),
+        name="Date",
+    )
+    # The fields are already typed by pydantic (floats plus int volume), so
+    # a single astype over the dtype dict is a block-level no-op assertion
+    # rather than a per-column re-parse of the values
+    df = df.astype(
+        {"open": np.float64, "close": np.float64, "high": np.float64, "low": np.float64, "volume": np.int64},
+        copy=False,
+    )
     return df
 
 
+def prices_to_arrays(prices: list[Price]) -> dict[str, np.ndarray]:
+    """
+    Convert Price objects to typed NumPy column arrays (structure-of-arrays).
+
+    A lightweight alternative to prices_to_df for callers that only need the
+    numeric columns; skips DataFrame/index construction entirely and walks the
+    model list once, filling a single PRICE_DTYPE structured array. Binance
+    returns klines in ascending time order, so the arrays are chronological.
+
+    Args:
+        prices: List of Price objects from get_prices()
+
+    Returns:
+        dict[str, np.ndarray]: float64 OHLCV column arrays keyed by field name
+    """
+    arr = np.fromiter(
+        ((p.open, p.high, p.low, p.close, p.volume) for p in prices),
+        dtype=PRICE_DTYPE,
+        count=len(prices),
+    )
+    return {name: arr[name] for name in PRICE_DTYPE.names}
+
+
 def get_price_data(symbol: str, start_date: str, end_date: str, interval: str = "1d", api_key: str = None) -> pd.DataFrame:
     """
     Get cryptocurrency price data as a DataFrame.
@@ -796,3 +1068,28 @@ def get_price_data(symbol: str, start_date: str, end_date: str, interval: str =
     """
     prices = get_prices(symbol, start_date, end_date, interval, api_key=api_key)
     return prices_to_df(prices)
+
+
+def get_price_arrays(symbol: str, start_date: str, end_date: str, interval: str = "1d", api_key: str = None) -> dict[str, np.ndarray]:
+    """
+    Get cryptocurrency price data as typed NumPy column arrays.
+
+    The array-returning counterpart to get_price_data for callers that only
+    run rolling-window math over the columns: it skips DataFrame and index
+    construction entirely and adds a datetime64 "time" column alongside the
+    OHLCV arrays from prices_to_arrays.
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        interval: Candlestick interval (default: '1d')
+        api_key: Optional API key
+
+    Returns:
+        dict[str, np.ndarray]: float64 OHLCV arrays plus a datetime64[s] "time" array
+    """
+    prices = get_prices(symbol, start_date, end_date, interval, api_key=api_key)
+    arrays = prices_to_arrays(prices)
+    arrays["time"] = np.array([p.time for p in prices], dtype="datetime64[s]")
+    return arrays
@@ -41,8 +41,29 @@ class AgentProgress:
             self.live.stop()
             self.started = False
 
+    def is_attached(self) -> bool:
+        """Return True if anything is consuming updates (live display or handlers)."""
+        return self.started or bool(self.update_handlers)
+
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None):
         """Update the status of an agent."""
+        self._apply_update(agent_name, ticker, status, analysis)
+        self._refresh_display()
+
+    def update_statuses(self, agent_name: str, updates: List[tuple]):
+        """Apply a batch of (ticker, status) updates with a single display refresh.
+
+        Each entry is (ticker, status) or (ticker, status, analysis). Handlers
+        are still notified per entry, but the live table is only rebuilt once,
+        so a loop over many tickers doesn't pay one refresh per call.
+        """
+        for update in updates:
+            analysis = update[2] if len(update) > 2 else None
+            self._apply_update(agent_name, update[0], update[1], analysis)
+        self._refresh_display()
+
+    def _apply_update(self, agent_name: str, ticker: Optional[str], status: str, analysis: Optional[str]):
+        """Record one status update and notify handlers (no display refresh)."""
         if agent_name not in self.agent_status:
             self.agent_status[agent_name] = {"status": "", "ticker": None}
 
@@ -61,8 +82,6 @@ class AgentProgress:
         for handler in self.update_handlers:
             handler(agent_name, ticker, status, analysis, timestamp)
 
-        self._refresh_display()
-
     def get_all_status(self):
         """Get the current status of all agents as a dictionary."""
         return {agent_name: {"ticker": info["ticker"], "status": info["status"], "display_name": self._get_display_name(agent_name)} for agent_name, info in self.agent_status.items()}
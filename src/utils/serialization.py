@@ -0,0 +1,23 @@
+"""JSON serialization helpers shared by the agents."""
+
+try:
+    import orjson
+
+    def to_json(obj) -> str:
+        """Serialize an object to a JSON string using orjson (handles NumPy scalars natively)."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def from_json(data):
+        """Parse JSON from bytes or str using orjson."""
+        return orjson.loads(data)
+
+except ImportError:  # orjson is an optional accelerator; fall back to the stdlib
+    import json
+
+    def to_json(obj) -> str:
+        """Serialize an object to a JSON string with the stdlib json module."""
+        return json.dumps(obj)
+
+    def from_json(data):
+        """Parse JSON from bytes or str with the stdlib json module."""
+        return json.loads(data)
@@ -5,36 +5,38 @@ from dotenv import load_dotenv
 load_dotenv()  # Load environment variables first
 
 from src.graph.state import AgentState
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+import importlib
 import traceback
 
-# Create proper test state
+# Dates and state templates are computed once; create_test_state only copies
+# the templates and slots in a fresh analyst_signals dict per probe
 end_date = datetime.now().strftime('%Y-%m-%d')
-start_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
+start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+
+_BASE_DATA = {
+    'tickers': ['BTCUSDT'],
+    'show_reasoning': False,
+    'end_date': end_date,
+    'start_date': start_date
+}
+_BASE_METADATA = {
+    'BINANCE_API_KEY': None,
+    'show_reasoning': False,
+    'model_name': 'gemini-2.5-flash-preview-05-20',
+    'model_provider': 'Google'
+}
 
 def create_test_state():
-    # Create test state with proper structure
-    from datetime import datetime, timedelta
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    
-    state = AgentState(
+    # AgentState is a TypedDict, so this is plain dict construction; the
+    # metadata template is shared as-is (agents only read it), while data
+    # gets its own analyst_signals dict so concurrent probes don't collide
+    return AgentState(
         messages=[],
-        data={
-            'tickers': ['BTCUSDT'],
-            'analyst_signals': {},
-            'show_reasoning': False,
-            'end_date': end_date,
-            'start_date': start_date
-        },
-        metadata={
-            'BINANCE_API_KEY': None,
-            'show_reasoning': False,
-            'model_name': 'gemini-2.5-flash-preview-05-20',
-            'model_provider': 'Google'
-        }
+        data={**_BASE_DATA, 'analyst_signals': {}},
+        metadata=_BASE_METADATA
     )
-    return state  # Added return statement!
 
 # Test all agents
 agents_to_test = [
@@ -50,29 +52,53 @@ agents_to_test = [
     ('stanley_druckenmiller', 'stanley_druckenmiller_agent'),
 ]
 
-print("=" * 80)
-print("TESTING ALL AGENTS AFTER BINANCE API MIGRATION")
-print("=" * 80)
+# Resolve every agent callable up-front into one dispatch table; import
+# failures are remembered so they still report per-agent below
+AGENT_FUNCS = {}
+_IMPORT_ERRORS = {}
+for _module_name, _func_name in agents_to_test:
+    try:
+        AGENT_FUNCS[_func_name] = getattr(importlib.import_module(f'src.agents.{_module_name}'), _func_name)
+    except Exception as e:
+        _IMPORT_ERRORS[_func_name] = (e, traceback.TracebackException.from_exception(e))
 
-for module_name, func_name in agents_to_test:
-    print(f"\nTesting {func_name}...")
+def _run_one(module_name, func_name):
+    # Each probe gets its own state so concurrent agents don't share mutables
+    if func_name in _IMPORT_ERRORS:
+        error, tbe = _IMPORT_ERRORS[func_name]
+        return func_name, error, tbe
     try:
-        module = __import__(f'src.agents.{module_name}', fromlist=[func_name])
-        agent_func = getattr(module, func_name)
         state = create_test_state()
-        result = agent_func(state)
-        print(f'  ✅ SUCCESS')
+        AGENT_FUNCS[func_name](state)
+        return func_name, None, None
     except Exception as e:
-        print(f'  ❌ ERROR: {type(e).__name__}: {str(e)[:100]}')
+        # Capture a structured traceback instead of a formatted string so the
+        # reporter below can walk FrameSummary objects rather than grep lines
+        return func_name, e, traceback.TracebackException.from_exception(e)
+
+print("=" * 80)
+print("TESTING ALL AGENTS AFTER BINANCE API MIGRATION")
+print("=" * 80)
+
+# Agent probes are dominated by Binance/LLM network I/O, so run them all at
+# once and report as they finish — wall time is max latency, not the sum
+with ThreadPoolExecutor(max_workers=len(agents_to_test)) as ex:
+    futures = {ex.submit(_run_one, m, f): f for m, f in agents_to_test}
+    for future in as_completed(futures):
+        func_name, error, tbe = future.result()
+        print(f"\nTesting {func_name}...")
+        if error is None:
+            print(f'  ✅ SUCCESS')
+            continue
+        print(f'  ❌ ERROR: {type(error).__name__}: {str(error)[:100]}')
         # Print full traceback for peter_lynch to debug
         if func_name == 'peter_lynch_agent':
-            print(traceback.format_exc())
+            print(''.join(tbe.format()))
         else:
-            # Print relevant traceback line
-            tb = traceback.format_exc()
-            for line in tb.split('\n'):
-                if 'agents/' in line and 'File' in line:
-                    print(f'     {line.strip()}')
-                    break
+            # Report the innermost agent frame, filtered on filename instead
+            # of string-matching every formatted traceback line
+            frame = next((f for f in reversed(tbe.stack) if 'agents/' in f.filename), None)
+            if frame:
+                print(f'     File "{frame.filename}", line {frame.lineno}, in {frame.name}')
 
 print("\n" + "=" * 80)
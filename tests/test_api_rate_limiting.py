@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 from unittest.mock import Mock, patch, call
@@ -7,16 +8,19 @@ from src.tools.api import _make_api_request, get_prices
 class TestRateLimiting:
     """Test suite for API rate limiting functionality."""
 
+    @patch('src.tools.api.random.uniform', return_value=1.0)
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
-    def test_handles_single_rate_limit(self, mock_get, mock_sleep):
+    @patch('src.tools.api._session.get')
+    def test_handles_single_rate_limit(self, mock_get, mock_sleep, mock_uniform):
         """Test that API retries once after a 429 and succeeds."""
         # Setup mock responses: first 429, then 200
         mock_429_response = Mock()
         mock_429_response.status_code = 429
+        mock_429_response.headers = {}
         
         mock_200_response = Mock()
         mock_200_response.status_code = 200
+        mock_200_response.headers = {}
         mock_200_response.text = "Success"
         
         mock_get.side_effect = [mock_429_response, mock_200_response]
@@ -31,26 +35,29 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called twice
+        # Verify session.get was called twice
         assert mock_get.call_count == 2
         mock_get.assert_has_calls([
-            call(url, headers=headers),
-            call(url, headers=headers)
+            call(url, headers=headers, params=None),
+            call(url, headers=headers, params=None)
         ])
         
         # Verify sleep was called once with 60 seconds (first retry)
         mock_sleep.assert_called_once_with(60)
 
+    @patch('src.tools.api.random.uniform', return_value=1.0)
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
-    def test_handles_multiple_rate_limits(self, mock_get, mock_sleep):
+    @patch('src.tools.api._session.get')
+    def test_handles_multiple_rate_limits(self, mock_get, mock_sleep, mock_uniform):
         """Test that API retries multiple times after 429s."""
         # Setup mock responses: three 429s, then 200
         mock_429_response = Mock()
         mock_429_response.status_code = 429
+        mock_429_response.headers = {}
         
         mock_200_response = Mock()
         mock_200_response.status_code = 200
+        mock_200_response.headers = {}
         mock_200_response.text = "Success"
         
         mock_get.side_effect = [
@@ -70,24 +77,27 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called 4 times
+        # Verify session.get was called 4 times
         assert mock_get.call_count == 4
         
-        # Verify sleep was called 3 times with linear backoff: 60s, 90s, 120s
+        # Verify sleep was called 3 times with exponential backoff: 60s, 120s, 240s
         assert mock_sleep.call_count == 3
-        expected_calls = [call(60), call(90), call(120)]
+        expected_calls = [call(60), call(120), call(240)]
         mock_sleep.assert_has_calls(expected_calls)
 
+    @patch('src.tools.api.random.uniform', return_value=1.0)
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.post')
-    def test_handles_post_rate_limiting(self, mock_post, mock_sleep):
+    @patch('src.tools.api._session.post')
+    def test_handles_post_rate_limiting(self, mock_post, mock_sleep, mock_uniform):
         """Test that POST requests handle rate limiting."""
         # Setup mock responses: first 429, then 200
         mock_429_response = Mock()
         mock_429_response.status_code = 429
+        mock_429_response.headers = {}
         
         mock_200_response = Mock()
         mock_200_response.status_code = 200
+        mock_200_response.headers = {}
         mock_200_response.text = "Success"
         
         mock_post.side_effect = [mock_429_response, mock_200_response]
@@ -103,7 +113,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.post was called twice
+        # Verify session.post was called twice
         assert mock_post.call_count == 2
         mock_post.assert_has_calls([
             call(url, headers=headers, json=json_data),
@@ -114,12 +124,13 @@ class TestRateLimiting:
         mock_sleep.assert_called_once_with(60)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_ignores_other_errors(self, mock_get, mock_sleep):
         """Test that non-429 errors are returned without retrying."""
         # Setup mock response: 500 error
         mock_500_response = Mock()
         mock_500_response.status_code = 500
+        mock_500_response.headers = {}
         mock_500_response.text = "Internal Server Error"
         
         mock_get.return_value = mock_500_response
@@ -134,19 +145,20 @@ class TestRateLimiting:
         assert result.status_code == 500
         assert result.text == "Internal Server Error"
         
-        # Verify requests.get was called only once
+        # Verify session.get was called only once
         assert mock_get.call_count == 1
         
         # Verify sleep was never called
         mock_sleep.assert_not_called()
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_normal_success_requests(self, mock_get, mock_sleep):
         """Test that successful requests return immediately without retry."""
         # Setup mock response: 200 success
         mock_200_response = Mock()
         mock_200_response.status_code = 200
+        mock_200_response.headers = {}
         mock_200_response.text = "Success"
         
         mock_get.return_value = mock_200_response
@@ -161,16 +173,17 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called only once
+        # Verify session.get was called only once
         assert mock_get.call_count == 1
         
         # Verify sleep was never called
         mock_sleep.assert_not_called()
 
+    @patch('src.tools.api.random.uniform', return_value=1.0)
     @patch('src.tools.api._cache')
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
-    def test_full_integration(self, mock_get, mock_sleep, mock_cache):
+    @patch('src.tools.api._session.get')
+    def test_full_integration(self, mock_get, mock_sleep, mock_cache, mock_uniform):
         """Test that get_prices function properly handles rate limiting."""
         # Mock cache to return None (cache miss)
         mock_cache.get_prices.return_value = None
@@ -178,22 +191,17 @@ class TestRateLimiting:
         # Setup mock responses: first 429, then 200 with valid data
         mock_429_response = Mock()
         mock_429_response.status_code = 429
+        mock_429_response.headers = {}
         
         mock_200_response = Mock()
         mock_200_response.status_code = 200
-        mock_200_response.json.return_value = {
-            "ticker": "AAPL",
-            "prices": [
-                {
-                    "time": "2024-01-01T00:00:00Z",
-                    "open": 100.0,
-                    "close": 101.0,
-                    "high": 102.0,
-                    "low": 99.0,
-                    "volume": 1000
-                }
-            ]
-        }
+        mock_200_response.headers = {}
+        # get_prices parses response.content as a Binance klines array:
+        # [open_time, open, high, low, close, volume, close_time, ...]
+        mock_200_response.content = json.dumps([
+            [1704067200000, "100.0", "102.0", "99.0", "101.0", "1000",
+             1704153599999, "0", 0, "0", "0", "0"]
+        ]).encode()
         
         mock_get.side_effect = [mock_429_response, mock_200_response]
         
@@ -215,13 +223,15 @@ class TestRateLimiting:
         mock_cache.get_prices.assert_called_once()
         mock_cache.set_prices.assert_called_once()
 
+    @patch('src.tools.api.random.uniform', return_value=1.0)
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
-    def test_max_retries_exceeded(self, mock_get, mock_sleep):
+    @patch('src.tools.api._session.get')
+    def test_max_retries_exceeded(self, mock_get, mock_sleep, mock_uniform):
         """Test that function stops retrying after max_retries and returns final 429."""
         # Setup mock responses: all 429s (exceeds max retries)
         mock_429_response = Mock()
         mock_429_response.status_code = 429
+        mock_429_response.headers = {}
         mock_429_response.text = "Too Many Requests"
         
         mock_get.return_value = mock_429_response
@@ -236,12 +246,12 @@ class TestRateLimiting:
         assert result.status_code == 429
         assert result.text == "Too Many Requests"
         
-        # Verify requests.get was called 3 times (1 initial + 2 retries)
+        # Verify session.get was called 3 times (1 initial + 2 retries)
         assert mock_get.call_count == 3
         
-        # Verify sleep was called 2 times with linear backoff: 60s, 90s
+        # Verify sleep was called 2 times with exponential backoff: 60s, 120s
         assert mock_sleep.call_count == 2
-        expected_calls = [call(60), call(90)]
+        expected_calls = [call(60), call(120)]
         mock_sleep.assert_has_calls(expected_calls)
 
 